@@ -16,11 +16,14 @@ from homeassistant.helpers.event import async_track_utc_time_change
 from homeassistant.helpers.service import ServiceCall
 from homeassistant.helpers.typing import ConfigType
 
+from .api_key_manager import ApiKeyManager
 from .config_flow import VolvoCarsFlowHandler, get_setting
 from .const import (
     CONF_VCC_API_KEY,
     CONF_VIN,
+    DEFAULT_API_DAILY_BUDGET,
     DOMAIN,
+    OPT_API_DAILY_BUDGET,
     OPT_FUEL_CONSUMPTION_UNIT,
     OPT_UNIT_LITER_PER_100KM,
     PLATFORMS,
@@ -36,12 +39,19 @@ from .coordinator import (
 )
 from .data_manager import VOLVO_CARS_KEY
 from .entity import get_entity_id
-from .factory import async_create_auth_api
+from .factory import async_create_auth_api, get_api_base_url
 from .store import VolvoCarsStoreManager
 from .volvo.api import VolvoCarsApi
+from .volvo.cache import VolvoCarsResponseCache
 
 _LOGGER = logging.getLogger(__name__)
 
+# Repeated reads within a few seconds are served from memory. Vehicle details
+# ("") and available commands rarely change, so they are kept longer.
+_API_CACHE_SIZE = 32
+_API_CACHE_DEFAULT_TTL = 5
+_API_CACHE_TTLS = {"": 300, "commands": 300}
+
 _SERVICE_REFRESH_SCHEMA = vol.Schema(
     {
         vol.Optional(SERVICE_PARAM_ENTRY): str,
@@ -90,12 +100,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: VolvoCarsConfigEntry) ->
     store = VolvoCarsStoreManager(hass, entry.unique_id)
     await store.async_load()
 
+    # Register the API key, so the cars sharing it can be coordinated
+    api_key = get_setting(entry, CONF_VCC_API_KEY)
+    api_key_manager = ApiKeyManager.get_or_create(hass)
+    entry.async_on_unload(
+        api_key_manager.async_register(
+            api_key,
+            entry.entry_id,
+            int(entry.options.get(OPT_API_DAILY_BUDGET, DEFAULT_API_DAILY_BUDGET)),
+        )
+    )
+
     # Create APIs
     client = async_get_clientsession(hass)
     api = VolvoCarsApi(
         client,
         get_setting(entry, CONF_VIN),
-        get_setting(entry, CONF_VCC_API_KEY),
+        api_key,
+        VolvoCarsResponseCache(
+            _API_CACHE_SIZE, _API_CACHE_DEFAULT_TTL, _API_CACHE_TTLS
+        ),
+        api_key_manager.get_limiter(api_key),
+        base_url=get_api_base_url(),
     )
     auth_api = await async_create_auth_api(hass, client, api.update_access_token)
 
@@ -183,6 +209,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: VolvoCarsConfigEntry) -
 
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         entry.runtime_data.token_coordinator.cancel_refresh()
+        await entry.runtime_data.store.async_flush()
 
     return unload_ok
 
@@ -0,0 +1,98 @@
+"""API key manager."""
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+from .volvo.limiter import VolvoCarsRateLimiter
+
+_LOGGER = logging.getLogger(__name__)
+
+API_KEY_MANAGER_KEY: HassKey[ApiKeyManager] = HassKey(f"{DOMAIN}_api_keys")
+
+# Limits shared by all cars using the same API key
+_RATE = 5
+_BURST = 10
+_CONCURRENCY = 8
+
+
+class ApiKeyManager:
+    """Coordinate the cars that share an API key."""
+
+    def __init__(self) -> None:
+        """Initialize class."""
+        self._entries: dict[str, list[str]] = {}
+        self._budgets: dict[str, dict[str, int]] = {}
+        self._limiters: dict[str, VolvoCarsRateLimiter] = {}
+
+    @classmethod
+    def get_or_create(cls, hass: HomeAssistant) -> ApiKeyManager:
+        """Get the manager and create if necessary."""
+        if (manager := hass.data.get(API_KEY_MANAGER_KEY)) is None:
+            manager = cls()
+            hass.data[API_KEY_MANAGER_KEY] = manager
+
+        return manager
+
+    def get_limiter(self, api_key: str) -> VolvoCarsRateLimiter:
+        """Get the rate limiter of an API key and create if necessary."""
+        if (limiter := self._limiters.get(api_key)) is None:
+            limiter = VolvoCarsRateLimiter(_RATE, _BURST, _CONCURRENCY)
+            self._limiters[api_key] = limiter
+
+        return limiter
+
+    @callback
+    def async_register(
+        self, api_key: str, entry_id: str, budget: int | None = None
+    ) -> CALLBACK_TYPE:
+        """Register an entry that uses the API key.
+
+        The budget is the daily API request budget configured for the entry.
+        """
+        entries = self._entries.setdefault(api_key, [])
+        entries.append(entry_id)
+        budgets = self._budgets.setdefault(api_key, {})
+
+        if budget is not None:
+            budgets[entry_id] = budget
+
+        @callback
+        def unregister() -> None:
+            entries.remove(entry_id)
+            budgets.pop(entry_id, None)
+
+            if not entries:
+                _LOGGER.debug("Releasing resources of API key")
+                self._entries.pop(api_key, None)
+                self._budgets.pop(api_key, None)
+                self._limiters.pop(api_key, None)
+
+        return unregister
+
+    def get_budget(self, api_key: str) -> int | None:
+        """Return the daily API request budget of the API key.
+
+        The quota belongs to the API key, so when the entries sharing the key
+        are configured with different budgets, the lowest budget applies.
+        Returns None if no entry configured a budget.
+        """
+        budgets = self._budgets.get(api_key)
+        return min(budgets.values()) if budgets else None
+
+    def get_phase(self, api_key: str, entry_id: str, interval: float) -> float | None:
+        """Return the offset of the entry within the interval, in seconds.
+
+        The refreshes of the entries sharing the API key are spread evenly
+        over the interval. Returns None if the entry doesn't share the key.
+        """
+        entries = self._entries.get(api_key, [])
+
+        if len(entries) < 2 or entry_id not in entries:
+            return None
+
+        return entries.index(entry_id) * interval / len(entries)
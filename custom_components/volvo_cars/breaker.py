@@ -0,0 +1,79 @@
+"""Volvo Cars circuit breaker."""
+
+from __future__ import annotations
+
+from enum import StrEnum
+import time
+from typing import Any
+
+# Number of consecutive failures before the circuit opens.
+_FAILURE_THRESHOLD = 3
+
+# Time the circuit stays open after reaching the threshold. It doubles with
+# every failed probe, up to the maximum.
+_BACKOFF_INITIAL = 300
+_BACKOFF_MAX = 6 * 3600
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop requesting a part of the data that keeps failing.
+
+    Once open, the circuit becomes half-open when the backoff has passed. The
+    next request is then a probe: if it succeeds, the circuit closes, otherwise
+    it opens again with a doubled backoff.
+    """
+
+    def __init__(self) -> None:
+        """Initialize circuit breaker."""
+        self.failures = 0
+        self.backoff: float = 0
+        self._open_until: float = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state."""
+        if self.failures < _FAILURE_THRESHOLD:
+            return CircuitState.CLOSED
+
+        if self.get_remaining() > 0:
+            return CircuitState.OPEN
+
+        return CircuitState.HALF_OPEN
+
+    def get_remaining(self) -> float:
+        """Return the number of seconds until the next probe is allowed."""
+        return max(0, self._open_until - time.monotonic())
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        self.failures = 0
+        self.backoff = 0
+        self._open_until = 0
+
+    def record_failure(self) -> None:
+        """Record a failed request."""
+        self.failures += 1
+
+        if self.failures < _FAILURE_THRESHOLD:
+            return
+
+        exponent = self.failures - _FAILURE_THRESHOLD
+        self.backoff = min(_BACKOFF_INITIAL * 2**exponent, _BACKOFF_MAX)
+        self._open_until = time.monotonic() + self.backoff
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state as a dict."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "backoff": self.backoff,
+            "retry_in": round(self.get_remaining()),
+        }
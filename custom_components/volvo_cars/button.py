@@ -140,7 +140,7 @@ class VolvoCarsButton(VolvoCarsEntity, ButtonEntity):
         if self.entity_description.non_api_command:
             if self.entity_description.key == "update_data":
                 _LOGGER.debug("Command update_data executing")
-                await self.coordinator.async_refresh()
+                await self.coordinator.async_full_refresh()
         else:
             try:
                 _LOGGER.debug(
@@ -153,6 +153,7 @@ class VolvoCarsButton(VolvoCarsEntity, ButtonEntity):
                     else None
                 )
 
+                self.coordinator.async_wake()
                 result = await self.coordinator.api.async_execute_command(
                     self.entity_description.api_command, data
                 )
@@ -174,5 +175,5 @@ class VolvoCarsButton(VolvoCarsEntity, ButtonEntity):
                 _LOGGER.debug("Command %s error", self.entity_description.api_command)
                 raise HomeAssistantError from ex
             finally:
-                await self.coordinator.async_update_request_count(1)
+                self.coordinator.async_update_request_count(1)
                 self.coordinator.async_update_listeners()
@@ -0,0 +1,138 @@
+"""Volvo Cars reporting cadence."""
+
+from __future__ import annotations
+
+from collections.abc import Container, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from .volvo.models import VolvoCarsApiBaseModel, VolvoCarsLocation, VolvoCarsValueField
+
+if TYPE_CHECKING:
+    from .store import StoreReportingCadence
+
+# Weight of a new interval in the moving average.
+_SMOOTHING = 0.3
+
+# Number of observed intervals before the cadence is trusted.
+_MIN_SAMPLES = 3
+
+# Polling is postponed until this fraction of the learned interval has passed
+# since the last report. Cars don't report at exact intervals, so it stays on
+# the safe side.
+_EXPECTED_FRACTION = 0.5
+
+
+def get_report_time(
+    data: Mapping[str, VolvoCarsApiBaseModel | None],
+) -> datetime | None:
+    """Return the time of the most recent report in the data."""
+    timestamps = [
+        value.timestamp
+        for value in data.values()
+        if isinstance(value, VolvoCarsValueField) and value.timestamp
+    ]
+    timestamps.extend(
+        value.properties.timestamp
+        for value in data.values()
+        if isinstance(value, VolvoCarsLocation) and value.properties.timestamp
+    )
+
+    return max(timestamps, default=None)
+
+
+@dataclass
+class ReportingCadence:
+    """Observed reporting cadence of a refresh part."""
+
+    last_report: datetime
+    interval: float | None = None
+    samples: int = 0
+
+    def update(self, report: datetime) -> bool:
+        """Update the cadence with a report and return True if it was new."""
+        if report <= self.last_report:
+            return False
+
+        delta = (report - self.last_report).total_seconds()
+        self.interval = (
+            delta
+            if self.interval is None
+            else _SMOOTHING * delta + (1 - _SMOOTHING) * self.interval
+        )
+        self.samples += 1
+        self.last_report = report
+        return True
+
+    def get_delay(self, now: datetime) -> float:
+        """Return the number of seconds before a new report can be expected."""
+        if self.interval is None or self.samples < _MIN_SAMPLES:
+            return 0
+
+        expected = self.last_report + timedelta(
+            seconds=self.interval * _EXPECTED_FRACTION
+        )
+        return max(0, (expected - now).total_seconds())
+
+
+class CadenceLearner:
+    """Learn the reporting cadence of each refresh part."""
+
+    def __init__(
+        self, stored: Mapping[str, StoreReportingCadence] | None = None
+    ) -> None:
+        """Initialize learner."""
+        self._cadences: dict[str, ReportingCadence] = {
+            name: ReportingCadence(
+                datetime.fromisoformat(cadence["last_report"]),
+                cadence["interval"],
+                cadence["samples"],
+            )
+            for name, cadence in (stored or {}).items()
+        }
+
+    @property
+    def cadences(self) -> dict[str, ReportingCadence]:
+        """Return the learned cadences."""
+        return self._cadences
+
+    def update(
+        self, name: str, data: Mapping[str, VolvoCarsApiBaseModel | None]
+    ) -> bool:
+        """Learn from the data of a part and return True if the cadence changed."""
+        if (report := get_report_time(data)) is None:
+            return False
+
+        if (cadence := self._cadences.get(name)) is None:
+            self._cadences[name] = ReportingCadence(report)
+            return True
+
+        return cadence.update(report)
+
+    def get_last_report(self, exclude: Container[str] = ()) -> datetime | None:
+        """Return the time of the most recent report of all parts."""
+        return max(
+            (
+                cadence.last_report
+                for name, cadence in self._cadences.items()
+                if name not in exclude
+            ),
+            default=None,
+        )
+
+    def get_delay(self, name: str, now: datetime) -> float:
+        """Return the number of seconds before a part can have new data."""
+        cadence = self._cadences.get(name)
+        return cadence.get_delay(now) if cadence else 0
+
+    def to_store(self) -> dict[str, StoreReportingCadence]:
+        """Return the learned cadences in store format."""
+        return {
+            name: {
+                "last_report": cadence.last_report.isoformat(),
+                "interval": cadence.interval,
+                "samples": cadence.samples,
+            }
+            for name, cadence in self._cadences.items()
+        }
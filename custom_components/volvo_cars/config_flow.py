@@ -25,6 +25,9 @@ from homeassistant.helpers.selector import (
     ColorRGBSelector,
     EntitySelector,
     EntitySelectorConfig,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     SelectSelector,
     SelectSelectorConfig,
 )
@@ -34,13 +37,16 @@ from .const import (
     CONF_OTP,
     CONF_VCC_API_KEY,
     CONF_VIN,
+    DEFAULT_API_DAILY_BUDGET,
     DOMAIN,
     MANUFACTURER,
+    OPT_API_DAILY_BUDGET,
     OPT_DEVICE_TRACKER_PICTURE,
     OPT_ENERGY_CONSUMPTION_UNIT,
     OPT_FUEL_CONSUMPTION_UNIT,
     OPT_IMG_BG_COLOR,
     OPT_IMG_TRANSPARENT,
+    OPT_TRACING,
     OPT_UNIT_ENERGY_KWH_PER_100KM,
     OPT_UNIT_ENERGY_MILES_PER_KWH,
     OPT_UNIT_LITER_PER_100KM,
@@ -339,7 +345,23 @@ class OptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
                     vol.Required(
                         CONF_VCC_API_KEY,
                         default=get_setting(self.config_entry, CONF_VCC_API_KEY),
-                    ): str
+                    ): str,
+                    vol.Required(
+                        OPT_API_DAILY_BUDGET,
+                        default=get_setting(self.config_entry, OPT_API_DAILY_BUDGET)
+                        or DEFAULT_API_DAILY_BUDGET,
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=100,
+                            max=100000,
+                            step=100,
+                            mode=NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Optional(
+                        OPT_TRACING,
+                        default=get_setting(self.config_entry, OPT_TRACING) or False,
+                    ): bool,
                 },
             ),
             **_create_section(
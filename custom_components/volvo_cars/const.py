@@ -21,16 +21,29 @@ CONF_OTP = "otp"
 CONF_VCC_API_KEY = "vcc_api_key"
 CONF_VIN = "vin"
 
+# Environment variable with the base URL of a simulated Volvo API, for load
+# and soak tests.
+ENV_API_BASE_URL = "VOLVO_CARS_API_BASE_URL"
+
 DATA_BATTERY_CAPACITY = "battery_capacity_kwh"
+DATA_POLLING_MODE = "polling_mode"
 DATA_REQUEST_COUNT = "api_request_count"
+DATA_REQUEST_ERRORS = "api_request_errors"
+DATA_REQUEST_HEADROOM = "api_request_headroom"
+DATA_REQUEST_LATENCY = "api_request_latency"
+DATA_REQUEST_PROJECTION = "api_request_projection"
+
+DEFAULT_API_DAILY_BUDGET = 10000
 
 MANUFACTURER = "Volvo"
 
+OPT_API_DAILY_BUDGET = "api_daily_budget"
 OPT_DEVICE_TRACKER_PICTURE = "device_tracker_picture"
 OPT_ENERGY_CONSUMPTION_UNIT = "energy_consumption_unit"
 OPT_FUEL_CONSUMPTION_UNIT = "fuel_consumption_unit"
 OPT_IMG_BG_COLOR = "image_bg_color"
 OPT_IMG_TRANSPARENT = "image_transparent"
+OPT_TRACING = "tracing"
 
 OPT_UNIT_ENERGY_KWH_PER_100KM = "kwh_100km"
 OPT_UNIT_ENERGY_MILES_PER_KWH = "miles_kwh"
@@ -6,7 +6,7 @@ import asyncio
 from collections import deque
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime, time, timedelta
 import logging
 from typing import Any, cast
 
@@ -17,22 +17,55 @@ from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DATA_BATTERY_CAPACITY, DATA_REQUEST_COUNT, DOMAIN, MANUFACTURER
+from .api_key_manager import ApiKeyManager
+from .breaker import CircuitBreaker, CircuitState
+from .cadence import CadenceLearner
+from .const import (
+    DATA_BATTERY_CAPACITY,
+    DATA_POLLING_MODE,
+    DATA_REQUEST_COUNT,
+    DATA_REQUEST_ERRORS,
+    DATA_REQUEST_HEADROOM,
+    DATA_REQUEST_LATENCY,
+    DATA_REQUEST_PROJECTION,
+    DEFAULT_API_DAILY_BUDGET,
+    DOMAIN,
+    MANUFACTURER,
+    OPT_API_DAILY_BUDGET,
+    OPT_TRACING,
+)
 from .entity_description import VolvoCarsDescription
-from .store import VolvoCarsStoreManager
-from .volvo.api import VolvoCarsApi
+from .modes import DormancyDetector, MotionDetector, PollingMode, get_polling_mode
+from .quota import QuotaGovernor
+from .scheduler import RefreshCadence, RefreshPart, RefreshScheduler
+from .store import StoreCapabilities, VolvoCarsStoreManager
+from .volvo.api import API_STATUS_OK, API_STATUS_UNKNOWN, VolvoCarsApi, count_requests
 from .volvo.auth import VolvoCarsAuthApi
 from .volvo.models import (
     AuthorizationModel,
     VolvoApiException,
     VolvoAuthException,
     VolvoCarsApiBaseModel,
+    VolvoCarsValue,
     VolvoCarsValueField,
     VolvoCarsVehicle,
 )
+from .volvo.tracing import VolvoCarsTracer, span
 
 _LOGGER = logging.getLogger(__name__)
 
+# A stored capability profile younger than the TTL is used instead of probing
+# the API. Once older than the revalidation age, it is probed again in the
+# background.
+_CAPABILITIES_TTL = timedelta(days=7)
+_CAPABILITIES_REVALIDATE = timedelta(days=1)
+
+# Interval at which the API status is checked.
+_API_STATUS_INTERVAL = timedelta(minutes=5)
+
+# Number of refreshes kept when tracing is enabled.
+_MAX_TRACES = 20
+
 
 @dataclass
 class VolvoCarsData:
@@ -71,6 +104,12 @@ class VolvoCarsDataCoordinator(DataUpdateCoordinator[CoordinatorData]):
 
         self.store = store
         self.api = api
+        self.governor = QuotaGovernor(
+            int(entry.options.get(OPT_API_DAILY_BUDGET, DEFAULT_API_DAILY_BUDGET))
+        )
+        self.tracer = VolvoCarsTracer(
+            _MAX_TRACES, enabled=entry.options.get(OPT_TRACING, False)
+        )
 
         self.vehicle: VolvoCarsVehicle
         self.device: DeviceInfo
@@ -83,15 +122,25 @@ class VolvoCarsDataCoordinator(DataUpdateCoordinator[CoordinatorData]):
         self.supports_windows: bool = False
         self.unsupported_keys: list[str] = []
 
-        # Keys must match the values of the data field of the "refresh_data" service.
-        # The variable is set during _async_setup().
-        self._refresh_conditions: dict[
-            str, tuple[Callable[[], Coroutine[Any, Any, Any]], bool]
-        ] = {}
-
-        # Values must match with a key from self._refresh_conditions.
-        # If list is empty, a full data refresh will occur, otherwise
-        # only the indicated data will be refreshed.
+        # Part names must match the values of the data field of the
+        # "refresh_data" service. The parts are set during _async_setup().
+        self._scheduler = RefreshScheduler()
+        self._motion = MotionDetector()
+        self._dormancy = DormancyDetector()
+        self.api_outage = False
+        self._api_status: dict[str, VolvoCarsValue] | None = None
+        self._api_status_expires: datetime | None = None
+        self._cadences = CadenceLearner(store.data.get("reporting_cadences"))
+
+        # Listeners per API field, and the data and update status they were
+        # last notified of.
+        self._field_listeners: dict[str, dict[CALLBACK_TYPE, CALLBACK_TYPE]] = {}
+        self._notified_data: CoordinatorData = {}
+        self._notified_success = True
+
+        # Values must match with a part name of self._scheduler.
+        # If list is empty, only the parts that are due will be refreshed,
+        # otherwise only the indicated data will be refreshed.
         self._refresh_parts: list[str] = []
 
     async def _async_setup(self) -> None:
@@ -103,14 +152,30 @@ class VolvoCarsDataCoordinator(DataUpdateCoordinator[CoordinatorData]):
         _LOGGER.debug("%s - Setting up", self.config_entry.entry_id)
         count = 0
 
+        probe_data: dict[str, CoordinatorData] = {}
+
         try:
-            vehicle = await self.api.async_get_vehicle_details()
+            # The capabilities don't depend on the vehicle details, so both
+            # are retrieved concurrently.
+            capabilities = asyncio.create_task(self._async_load_capabilities())
+
+            # When the setup fails, the probing is stopped, so the
+            # capabilities don't change afterwards.
+            try:
+                vehicle = await self.api.async_get_vehicle_details()
+            except BaseException:
+                await _async_cancel(capabilities)
+                raise
+
             count += 1
 
             if vehicle is None:
+                await _async_cancel(capabilities)
                 _LOGGER.error("Unable to retrieve vehicle details")
                 raise VolvoApiException("Unable to retrieve vehicle details.")
 
+            probe_count, probe_data = await capabilities
+            count += probe_count
             self.vehicle = vehicle
 
             device_name = (
@@ -132,83 +197,201 @@ class VolvoCarsDataCoordinator(DataUpdateCoordinator[CoordinatorData]):
                 title=f"{MANUFACTURER} {vehicle.description.model} ({vehicle.vin})",
             )
 
-            count += await self._async_determine_features()
-
         finally:
             self.data = self.data or {}
-            await self.async_update_request_count(count)
-
-        self._refresh_conditions = {
-            "availability": (self.api.async_get_availability_status, True),
-            "brakes": (self.api.async_get_brakes_status, True),
-            "diagnostics": (self.api.async_get_diagnostics, True),
-            "doors": (self.api.async_get_doors_status, self.supports_doors),
-            "engine_status": (self.api.async_get_engine_status, True),
-            "engine": (self.api.async_get_engine_warnings, True),
-            "fuel": (
-                self.api.async_get_fuel_status,
-                self.vehicle.has_combustion_engine(),
-            ),
-            "location": (self.api.async_get_location, self.supports_location),
-            "odometer": (self.api.async_get_odometer, True),
-            "recharge_status": (
-                self.api.async_get_recharge_status,
-                self.vehicle.has_battery_engine(),
-            ),
-            "statistics": (self.api.async_get_statistics, True),
-            "tyres": (self.api.async_get_tyre_states, self.supports_tyres),
-            "warnings": (self.api.async_get_warnings, self.supports_warnings),
-            "windows": (self.api.async_get_window_states, self.supports_windows),
-        }
+            self.async_update_request_count(count)
+
+        self._scheduler.set_parts(
+            {
+                "availability": RefreshPart(
+                    self.api.async_get_availability_status,
+                    True,
+                    RefreshCadence.FAST,
+                    heartbeat=True,
+                ),
+                "brakes": RefreshPart(
+                    self.api.async_get_brakes_status, True, RefreshCadence.DAILY
+                ),
+                "diagnostics": RefreshPart(
+                    self.api.async_get_diagnostics, True, RefreshCadence.DAILY
+                ),
+                "doors": RefreshPart(
+                    self.api.async_get_doors_status,
+                    self.supports_doors,
+                    RefreshCadence.FAST,
+                ),
+                "engine_status": RefreshPart(
+                    self.api.async_get_engine_status, True, RefreshCadence.FAST
+                ),
+                "engine": RefreshPart(
+                    self.api.async_get_engine_warnings, True, RefreshCadence.SLOW
+                ),
+                "fuel": RefreshPart(
+                    self.api.async_get_fuel_status,
+                    self.vehicle.has_combustion_engine(),
+                    RefreshCadence.NORMAL,
+                ),
+                "location": RefreshPart(
+                    self.api.async_get_location,
+                    self.supports_location,
+                    RefreshCadence.NORMAL,
+                    {PollingMode.DRIVING: RefreshCadence.FAST},
+                ),
+                "odometer": RefreshPart(
+                    self.api.async_get_odometer,
+                    True,
+                    RefreshCadence.NORMAL,
+                    {PollingMode.DRIVING: RefreshCadence.FAST},
+                ),
+                "recharge_status": RefreshPart(
+                    self.api.async_get_recharge_status,
+                    self.vehicle.has_battery_engine(),
+                    RefreshCadence.SLOW,
+                    {
+                        PollingMode.DRIVING: RefreshCadence.FAST,
+                        PollingMode.PLUGGED_IN: RefreshCadence.FAST,
+                        PollingMode.CHARGING: RefreshCadence.FAST,
+                    },
+                ),
+                "statistics": RefreshPart(
+                    self.api.async_get_statistics,
+                    True,
+                    RefreshCadence.NORMAL,
+                    {PollingMode.DRIVING: RefreshCadence.FAST},
+                ),
+                "tyres": RefreshPart(
+                    self.api.async_get_tyre_states,
+                    self.supports_tyres,
+                    RefreshCadence.DAILY,
+                ),
+                "warnings": RefreshPart(
+                    self.api.async_get_warnings,
+                    self.supports_warnings,
+                    RefreshCadence.SLOW,
+                ),
+                "windows": RefreshPart(
+                    self.api.async_get_window_states,
+                    self.supports_windows,
+                    RefreshCadence.FAST,
+                ),
+            }
+        )
+
+        # Reuse the probe responses as data, so the first refresh doesn't
+        # request the same parts again.
+        for name, part_data in probe_data.items():
+            if self._scheduler.is_enabled(name):
+                self.data |= part_data
+                self._scheduler.mark_refreshed(name)
+
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        # Trace the whole refresh, including the notification of the
+        # listeners after the data was fetched.
+        with self.tracer.trace("refresh"):
+            await super()._async_refresh(*args, **kwargs)
 
     async def _async_update_data(self) -> CoordinatorData:
         """Fetch data from API."""
         _LOGGER.debug("%s - Updating data", self.config_entry.entry_id)
 
-        api_calls = self._get_api_calls()
-        data: CoordinatorData = self.data if self._refresh_parts else {}
+        data: CoordinatorData = dict(self.data)
         valid = 0
         exception: Exception | None = None
-
-        try:
-            results = await asyncio.gather(
-                *(call() for call in api_calls), return_exceptions=True
+        refreshed: list[str] = []
+        cadences_changed = False
+
+        # The API status is checked first, because there is no point in
+        # requesting data during an outage.
+        api_status = await self._async_get_api_status()
+        data |= api_status
+        valid += 1
+
+        outage = self._is_outage(api_status)
+
+        # Only log the changes, not every update during the outage
+        if outage and not self.api_outage:
+            _LOGGER.warning(
+                "%s - Skipping data updates, Volvo API reports: %s",
+                self.config_entry.entry_id,
+                api_status["apiStatus"].value,
             )
+        elif self.api_outage and not outage:
+            _LOGGER.info(
+                "%s - Volvo API recovered, resuming data updates",
+                self.config_entry.entry_id,
+            )
+
+        self.api_outage = outage
+        parts = [] if outage else self._get_parts_to_refresh()
 
-            for result in results:
-                if isinstance(result, VolvoAuthException):
-                    # If one result is a VolvoAuthException, then probably all requests
-                    # will fail. In this case we can cancel everything to
-                    # reauthenticate.
-                    #
-                    # Raising ConfigEntryAuthFailed will cancel future updates
-                    # and start a config flow with SOURCE_REAUTH (async_step_reauth)
-                    _LOGGER.exception(
-                        "%s - Authentication failed. %s",
-                        self.config_entry.entry_id,
-                        result.message,
-                    )
-                    raise ConfigEntryAuthFailed(
-                        f"Authentication failed. {result.message}"
-                    ) from result
-
-                if isinstance(result, VolvoApiException):
-                    # Maybe it's just one call that fails. Log the error and
-                    # continue processing the other calls.
-                    _LOGGER.warning(
-                        "%s - Error during data update: %s",
-                        self.config_entry.entry_id,
-                        result.message,
-                    )
-                    exception = exception or result
-                    continue
-
-                if isinstance(result, Exception):
-                    # Something bad happened, raise immediately.
-                    raise result
-
-                data |= cast("CoordinatorData", result)
-                valid += 1
+        api_calls = self._get_api_calls(parts)
+
+        # The tasks inherit the counter, so requests of commands or other
+        # callers that run at the same time aren't counted.
+        with count_requests() as request_counter:
+            pending = {
+                asyncio.create_task(call()): name
+                for name, call in zip(parts, api_calls, strict=True)
+            }
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                updated_keys: set[str] = set()
+
+                for task in done:
+                    name = pending.pop(task)
+                    result = task.exception() or task.result()
+
+                    if isinstance(result, VolvoAuthException):
+                        # If one result is a VolvoAuthException, then probably
+                        # all requests will fail. In this case we can cancel
+                        # everything to reauthenticate.
+                        #
+                        # Raising ConfigEntryAuthFailed will cancel future
+                        # updates and start a config flow with SOURCE_REAUTH
+                        # (async_step_reauth)
+                        _LOGGER.exception(
+                            "%s - Authentication failed. %s",
+                            self.config_entry.entry_id,
+                            result.message,
+                        )
+                        raise ConfigEntryAuthFailed(
+                            f"Authentication failed. {result.message}"
+                        ) from result
+
+                    if isinstance(result, VolvoApiException):
+                        # Maybe it's just one call that fails. Log the error and
+                        # continue processing the other calls.
+                        _LOGGER.warning(
+                            "%s - Error during data update: %s",
+                            self.config_entry.entry_id,
+                            result.message,
+                        )
+                        exception = exception or result
+                        self._mark_failed(name)
+                        continue
+
+                    if isinstance(result, BaseException):
+                        # Something bad happened, raise immediately.
+                        raise result
+
+                    with span("merge", part=name):
+                        data |= cast("CoordinatorData", result)
+
+                    updated_keys.update(result)
+                    valid += 1
+
+                    self._scheduler.mark_refreshed(name)
+                    refreshed.append(name)
+                    cadences_changed |= self._cadences.update(name, result)
+
+                # Publish the results that already arrived, so their entities
+                # don't have to wait for the slower calls.
+                if pending and updated_keys:
+                    self._publish_partial_data(data)
 
             # Raise an error if not a single API call succeeded
             if valid == 0:
@@ -219,6 +402,9 @@ class VolvoCarsDataCoordinator(DataUpdateCoordinator[CoordinatorData]):
 
                 raise UpdateFailed(message)
 
+            self._update_polling_mode(data)
+            self._align_with_cadences(refreshed, cadences_changed)
+
             # Add static values
             data[DATA_BATTERY_CAPACITY] = VolvoCarsValueField.from_dict(
                 {
@@ -227,20 +413,96 @@ class VolvoCarsDataCoordinator(DataUpdateCoordinator[CoordinatorData]):
                 }
             )
         finally:
-            # Save number of API requests made (excluding API status)
-            calls_to_add = len(api_calls) - 1
-            await self.async_update_request_count(calls_to_add, data)
+            for task in pending:
+                task.cancel()
+
+            # Save number of API requests made (excluding API status). Calls
+            # that were served from the cache or joined a pending request
+            # don't use quota.
+            calls_to_add = request_counter.sent
+            self.async_update_request_count(calls_to_add, data)
+            self._update_request_metrics(data)
+
+            seconds_until_reset = self._get_seconds_until_reset()
+            self._apply_quota(data, seconds_until_reset)
+
+            # Wake up again when the next part is due, or when the request
+            # count resets
+            next_delay = self._get_staggered_delay(
+                self._scheduler.get_next_delay(self._base_interval)
+            )
+            self.update_interval = timedelta(
+                seconds=min(next_delay, seconds_until_reset + 1)
+            )
 
         return data
 
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates.
+
+        Listeners with an API field as context are only notified when the
+        value of that field changed.
+        """
+        remove_listener = super().async_add_listener(update_callback, context)
+
+        if not context:
+            return remove_listener
+
+        field_listeners = self._field_listeners.setdefault(context, {})
+
+        @callback
+        def remove_field_listener() -> None:
+            """Remove update listener."""
+            field_listeners.pop(remove_field_listener, None)
+            remove_listener()
+
+        field_listeners[remove_field_listener] = update_callback
+        return remove_field_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners whose data changed."""
+        with span("notify"):
+            if self.last_update_success != self._notified_success:
+                # The availability of all entities changed
+                self._notified_success = self.last_update_success
+                self._notified_data = dict(self.data or {})
+                super().async_update_listeners()
+                return
+
+            self._notify_changed_fields()
+
+            # Listeners that are not bound to a field are always notified
+            for update_callback, context in list(self._listeners.values()):
+                if not context:
+                    update_callback()
+
+    async def async_full_refresh(self) -> None:
+        """Refresh all data, regardless of the schedule."""
+        await self.async_partial_refresh([])
+
     async def async_partial_refresh(self, parts: list[str]) -> None:
-        """Refresh data partially."""
+        """Refresh data partially.
+
+        If no parts are given, all data is refreshed.
+        """
         try:
-            self._refresh_parts = parts
+            self._refresh_parts = parts or self._scheduler.get_enabled_parts()
             await self.async_refresh()
         finally:
             self._refresh_parts = []
 
+    @callback
+    def async_wake(self) -> None:
+        """Leave the dormant polling mode, for example after a command."""
+        if self._wake():
+            self.config_entry.async_create_background_task(
+                self.hass, self.async_request_refresh(), name=f"{self.name} - wake"
+            )
+
     def get_api_field(
         self, description: VolvoCarsDescription
     ) -> VolvoCarsApiBaseModel | None:
@@ -248,7 +510,26 @@ class VolvoCarsDataCoordinator(DataUpdateCoordinator[CoordinatorData]):
 
         return self.data.get(description.api_field) if description.api_field else None
 
-    async def async_update_request_count(
+    def get_staleness(self) -> dict[str, float]:
+        """Return the number of seconds since the car reported each field."""
+        now = datetime.now(UTC)
+
+        return {
+            key: round((now - value.timestamp).total_seconds())
+            for key, value in self.data.items()
+            if isinstance(value, VolvoCarsValueField) and value.timestamp
+        }
+
+    def get_circuit_breakers(self) -> dict[str, CircuitBreaker]:
+        """Return the circuit breakers of the refresh parts."""
+        return self._scheduler.breakers
+
+    def get_request_demand(self, seconds: float) -> tuple[float, float]:
+        """Return the unthrottled number of requests in the coming seconds."""
+        return self._scheduler.get_request_demand(self._base_interval, seconds)
+
+    @callback
+    def async_update_request_count(
         self,
         calls_to_add: int,
         data: CoordinatorData | None = None,
@@ -258,16 +539,16 @@ class VolvoCarsDataCoordinator(DataUpdateCoordinator[CoordinatorData]):
         request_count = current_count + calls_to_add
 
         data = data or self.data
-        await self._async_set_request_count(request_count, data)
+        self._set_request_count(request_count, data)
 
     async def async_reset_request_count(self, _: datetime | None = None) -> None:
         """Reset the API request count."""
         _LOGGER.debug("%s - Resetting API request count", self.config_entry.entry_id)
-        await self._async_set_request_count(
+        self._set_request_count(
             0, self.data, update_listeners=True, set_reset_timestamp=True
         )
 
-    async def _async_set_request_count(
+    def _set_request_count(
         self,
         count: int,
         data: CoordinatorData | None,
@@ -276,9 +557,10 @@ class VolvoCarsDataCoordinator(DataUpdateCoordinator[CoordinatorData]):
         set_reset_timestamp: bool = False,
     ) -> None:
         reset_time = datetime.now(UTC).isoformat() if set_reset_timestamp else None
-        await self.store.async_update(
-            api_request_count=count, api_requests_reset_time=reset_time
-        )
+        with span("store_update", key="api_request_count"):
+            self.store.async_delay_update(
+                api_request_count=count, api_requests_reset_time=reset_time
+            )
 
         if data is not None:
             data[DATA_REQUEST_COUNT] = VolvoCarsValueField.from_dict(
@@ -291,70 +573,364 @@ class VolvoCarsDataCoordinator(DataUpdateCoordinator[CoordinatorData]):
         if update_listeners:
             self.async_update_listeners()
 
+    @property
+    def _base_interval(self) -> float:
+        return float(self.store.data["data_update_interval"])
+
+    def _update_polling_mode(self, data: CoordinatorData) -> None:
+        parked_timeout = self.store.data["parked_timeout"] * 60
+        in_motion = self._motion.update(data, parked_timeout)
+
+        heartbeat = data.get("availabilityStatus")
+        dormant = self._dormancy.update(
+            (heartbeat.value, heartbeat.get("unavailable_reason"))
+            if isinstance(heartbeat, VolvoCarsValue)
+            else None,
+            self._cadences.get_last_report(exclude=self._scheduler.get_heartbeats()),
+        )
+
+        mode = get_polling_mode(data, in_motion, dormant)
+
+        if mode != self._scheduler.mode:
+            _LOGGER.debug(
+                "%s - Switching to %s polling mode",
+                self.config_entry.entry_id,
+                mode,
+            )
+
+        self._scheduler.mode = mode
+        data[DATA_POLLING_MODE] = VolvoCarsValue(mode.value)
+
+    def _wake(self) -> bool:
+        self._dormancy.wake()
+
+        if self._scheduler.mode != PollingMode.DORMANT:
+            return False
+
+        _LOGGER.debug("%s - Waking up", self.config_entry.entry_id)
+        self._scheduler.mode = PollingMode.IDLE
+        return True
+
+    def _align_with_cadences(self, parts: list[str], changed: bool) -> None:
+        # Don't poll parts again before the car is expected to report new data
+        now = datetime.now(UTC)
+
+        for name in parts:
+            delay = self._cadences.get_delay(name, now)
+            self._scheduler.align(name, delay, self._base_interval)
+
+        if changed:
+            with span("store_update", key="reporting_cadences"):
+                self.store.async_delay_update(
+                    reporting_cadences=self._cadences.to_store()
+                )
+
+    def _mark_failed(self, name: str) -> None:
+        breaker = self._scheduler.mark_failed(name)
+
+        if breaker.state == CircuitState.OPEN:
+            _LOGGER.warning(
+                "%s - Refreshing %s failed %s times in a row, retrying in %ss",
+                self.config_entry.entry_id,
+                name,
+                breaker.failures,
+                breaker.backoff,
+            )
+
+    @callback
+    def _publish_partial_data(self, data: CoordinatorData) -> None:
+        self.data = data
+
+        with span("notify", partial=True):
+            self._notify_changed_fields()
+
+    @callback
+    def _notify_changed_fields(self) -> None:
+        previous = self._notified_data
+        current = self._notified_data = dict(self.data or {})
+
+        changed_fields = [
+            key
+            for key in previous.keys() | current.keys()
+            if previous.get(key) != current.get(key)
+        ]
+
+        for key in changed_fields:
+            for update_callback in list(self._field_listeners.get(key, {}).values()):
+                update_callback()
+
+    def _get_staggered_delay(self, delay: float) -> float:
+        # Spread the refreshes of the cars sharing the API key evenly over the
+        # data update interval, so they don't all request at the same time.
+        interval = self._base_interval
+        phase = ApiKeyManager.get_or_create(self.hass).get_phase(
+            self.api.api_key, self.config_entry.entry_id, interval
+        )
+
+        if phase is None:
+            return delay
+
+        due = self.hass.loop.time() + delay
+        return delay + (phase - due) % interval
+
+    def _get_seconds_until_reset(self) -> float:
+        now = datetime.now(UTC)
+        next_midnight = datetime.combine(
+            now.date() + timedelta(days=1), time(0, 0, 0, tzinfo=UTC)
+        )
+
+        return (next_midnight - now).total_seconds()
+
+    def _get_key_coordinators(self) -> list[VolvoCarsDataCoordinator]:
+        """Get the coordinators of all entries that share the same API key."""
+        coordinators: list[VolvoCarsDataCoordinator] = [self]
+
+        for entry in self.hass.config_entries.async_loaded_entries(DOMAIN):
+            if entry.entry_id == self.config_entry.entry_id:
+                continue
+
+            coordinator = cast("VolvoCarsConfigEntry", entry).runtime_data.coordinator
+
+            if coordinator.api.api_key == self.api.api_key:
+                coordinators.append(coordinator)
+
+        return coordinators
+
+    def _apply_quota(self, data: CoordinatorData, seconds_until_reset: float) -> None:
+        used = 0
+        demand = 0.0
+        low_priority_demand = 0.0
+
+        for coordinator in self._get_key_coordinators():
+            used += coordinator.store.data["api_request_count"]
+            total, low_priority = coordinator.get_request_demand(seconds_until_reset)
+            demand += total
+            low_priority_demand += low_priority
+
+        # The budget belongs to the API key, not to this entry
+        if budget := ApiKeyManager.get_or_create(self.hass).get_budget(
+            self.api.api_key
+        ):
+            self.governor.budget = budget
+
+        projection = self.governor.evaluate(used, demand, low_priority_demand)
+
+        if projection.throttle != self._scheduler.throttle:
+            _LOGGER.debug(
+                "%s - API quota throttle changed: %s",
+                self.config_entry.entry_id,
+                projection.throttle,
+            )
+
+        self._scheduler.throttle = projection.throttle
+
+        now = datetime.now(UTC)
+        data[DATA_REQUEST_PROJECTION] = VolvoCarsValueField.from_dict(
+            {"value": projection.projected, "timestamp": now}
+        )
+        data[DATA_REQUEST_HEADROOM] = VolvoCarsValueField.from_dict(
+            {"value": projection.headroom, "timestamp": now}
+        )
+
+    def _update_request_metrics(self, data: CoordinatorData) -> None:
+        metrics = self.api.request_metrics
+        now = datetime.now(UTC)
+
+        data[DATA_REQUEST_ERRORS] = VolvoCarsValueField.from_dict(
+            {"value": metrics.errors, "timestamp": now}
+        )
+        data[DATA_REQUEST_LATENCY] = VolvoCarsValueField.from_dict(
+            {"value": metrics.get_latency(95), "timestamp": now}
+        )
+
+    def _get_parts_to_refresh(self) -> list[str]:
+        if self._refresh_parts:
+            return [
+                part for part in self._refresh_parts if self._scheduler.is_enabled(part)
+            ]
+
+        return self._scheduler.get_due_parts(self._base_interval)
+
     def _get_api_calls(
-        self,
+        self, parts: list[str]
     ) -> list[Callable[[], Coroutine[Any, Any, Any]]]:
-        api_calls = [self.api.async_get_api_status]
-        api_calls.extend(
-            [
-                api_call
-                for part, (api_call, condition) in self._refresh_conditions.items()
-                if condition
-                and (len(self._refresh_parts) == 0 or part in self._refresh_parts)
-            ]
+        return [self._scheduler.parts[part].api_call for part in parts]
+
+    async def _async_get_api_status(self) -> dict[str, VolvoCarsValue]:
+        # The API status is checked on its own, slower, cadence
+        now = datetime.now(UTC)
+
+        if (
+            self._api_status is None
+            or self._api_status_expires is None
+            or now >= self._api_status_expires
+        ):
+            self._api_status = await self.api.async_get_api_status()
+
+            # Only a healthy status is cached. Any other status is checked
+            # again on the next update, so a recovery is picked up right away.
+            self._api_status_expires = (
+                now + _API_STATUS_INTERVAL
+                if self._api_status["apiStatus"].value == API_STATUS_OK
+                else None
+            )
+
+        return self._api_status
+
+    def _is_outage(self, api_status: dict[str, VolvoCarsValue]) -> bool:
+        # "Unknown" means the status couldn't be checked, which is not
+        # necessarily an outage.
+        return api_status["apiStatus"].value not in (
+            API_STATUS_OK,
+            API_STATUS_UNKNOWN,
         )
 
-        return api_calls
+    async def _async_load_capabilities(self) -> tuple[int, dict[str, CoordinatorData]]:
+        capabilities = self.store.data.get("capabilities")
 
-    async def _async_determine_features(self) -> int:
-        count = 0
+        if capabilities is None:
+            return await self._async_determine_features()
 
-        try:
-            # Check supported commands
-            # We're unable to use the scope 'conve:climatization_start_stop' that
-            # is required to use the "ENGINE_START" and "ENGINE_STOP" commands.
-            commands = await self.api.async_get_commands()
-            count += 1
+        age = datetime.now(UTC) - datetime.fromisoformat(capabilities["updated_at"])
+
+        if age >= _CAPABILITIES_TTL:
+            return await self._async_determine_features()
+
+        _LOGGER.debug("%s - Using stored capabilities", self.config_entry.entry_id)
+        self._apply_capabilities(capabilities)
+
+        if age >= _CAPABILITIES_REVALIDATE:
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_revalidate_capabilities(),
+                name=f"{self.name} - revalidate capabilities",
+            )
+
+        return 0, {}
+
+    async def _async_revalidate_capabilities(self) -> None:
+        _LOGGER.debug("%s - Revalidating capabilities", self.config_entry.entry_id)
+        previous = self.store.data.get("capabilities")
+        count, _ = await self._async_determine_features()
+        self.async_update_request_count(count)
+
+        if previous is None:
+            return
+
+        current = self.store.data.get("capabilities")
+
+        if current is None or current is previous:
+            # Probing failed, keep using the previous capabilities
+            self._apply_capabilities(previous)
+            return
+
+        if {**current, "updated_at": ""} != {**previous, "updated_at": ""}:
+            _LOGGER.debug(
+                "%s - Capabilities changed, reloading entry",
+                self.config_entry.entry_id,
+            )
+            self.hass.config_entries.async_schedule_reload(self.config_entry.entry_id)
+
+    def _apply_capabilities(self, capabilities: StoreCapabilities) -> None:
+        self.commands = list(capabilities["commands"])
+        self.supports_location = capabilities["supports_location"]
+        self.supports_doors = capabilities["supports_doors"]
+        self.supports_tyres = capabilities["supports_tyres"]
+        self.supports_warnings = capabilities["supports_warnings"]
+        self.supports_windows = capabilities["supports_windows"]
+        self.unsupported_keys = list(capabilities["unsupported_keys"])
+
+    def _save_capabilities(self) -> None:
+        self.store.async_delay_update(
+            capabilities=StoreCapabilities(
+                commands=self.commands,
+                supports_location=self.supports_location,
+                supports_doors=self.supports_doors,
+                supports_tyres=self.supports_tyres,
+                supports_warnings=self.supports_warnings,
+                supports_windows=self.supports_windows,
+                unsupported_keys=self.unsupported_keys,
+                updated_at=datetime.now(UTC).isoformat(),
+            )
+        )
+
+    async def _async_determine_features(
+        self,
+    ) -> tuple[int, dict[str, CoordinatorData]]:
+        """Probe the API for the supported features.
+
+        Return the number of requests made and the probe responses per part,
+        so they can be used as data.
+        """
+        probe_data: dict[str, CoordinatorData] = {}
+
+        # The probes are independent of each other, so run them concurrently.
+        # A failing probe doesn't discard the results of the other probes.
+        results = await asyncio.gather(
+            self.api.async_get_commands(),
+            self.api.async_get_location(),
+            self.api.async_get_doors_status(),
+            self.api.async_get_tyre_states(),
+            self.api.async_get_warnings(),
+            self.api.async_get_window_states(),
+            return_exceptions=True,
+        )
+        commands, location, doors, tyres, warnings, windows = results
+
+        for result in results:
+            if isinstance(result, BaseException):
+                _LOGGER.debug(
+                    "%s - Feature probe failed: %s",
+                    self.config_entry.entry_id,
+                    result,
+                )
+
+        # Check supported commands
+        # We're unable to use the scope 'conve:climatization_start_stop' that
+        # is required to use the "ENGINE_START" and "ENGINE_STOP" commands.
+        if not isinstance(commands, BaseException):
             self.commands = [
                 command.command
                 for command in commands
                 if command and command.command not in ("ENGINE_START", "ENGINE_STOP")
             ]
 
-            # Check if location is supported
-            location = await self.api.async_get_location()
-            count += 1
+        # Check if location, doors, tyres, warnings and windows are supported
+        if not isinstance(location, BaseException):
             self.supports_location = location.get("location") is not None
+            probe_data["location"] = cast("CoordinatorData", location)
 
-            # Check if doors are supported
-            doors = await self.api.async_get_doors_status()
-            count += 1
+        if not isinstance(doors, BaseException):
             self.supports_doors = not self._is_all_unspecified(doors)
+            probe_data["doors"] = cast("CoordinatorData", doors)
 
-            # Check if tyres are supported
-            tyres = await self.api.async_get_tyre_states()
-            count += 1
+        if not isinstance(tyres, BaseException):
             self.supports_tyres = not self._is_all_unspecified(tyres)
+            probe_data["tyres"] = cast("CoordinatorData", tyres)
 
-            # Check if warnings are supported
-            warnings = await self.api.async_get_warnings()
-            count += 1
+        if not isinstance(warnings, BaseException):
             self.supports_warnings = not self._is_all_unspecified(warnings)
+            probe_data["warnings"] = cast("CoordinatorData", warnings)
 
-            # Check if windows are supported
-            windows = await self.api.async_get_window_states()
-            count += 1
+        if not isinstance(windows, BaseException):
             self.supports_windows = not self._is_all_unspecified(windows)
+            probe_data["windows"] = cast("CoordinatorData", windows)
 
-            # Keep track of unsupported keys
-            self.unsupported_keys += [
-                key
-                for key, value in (doors | tyres | warnings | windows).items()
-                if value is None or value.value == "UNSPECIFIED"
-            ]
+        # Keep track of unsupported keys
+        self.unsupported_keys = [
+            key
+            for items in (doors, tyres, warnings, windows)
+            if not isinstance(items, BaseException)
+            for key, value in items.items()
+            if value is None or value.value == "UNSPECIFIED"
+        ]
 
-        finally:
-            return count
+        # Only a complete profile is stored. Otherwise the features are probed
+        # again at the next start.
+        if not any(isinstance(result, BaseException) for result in results):
+            self._save_capabilities()
+
+        return len(results), probe_data
 
     def _is_all_unspecified(self, items: dict[str, VolvoCarsValueField | None]) -> bool:
         return all(
@@ -362,6 +938,11 @@ class VolvoCarsDataCoordinator(DataUpdateCoordinator[CoordinatorData]):
         )
 
 
+async def _async_cancel(task: asyncio.Task) -> None:
+    task.cancel()
+    await asyncio.wait([task])
+
+
 class TokenCoordinator:
     """Coordinator for handling refresh tokens."""
 
@@ -1,5 +1,6 @@
 """Diagnostics for Volvo Cars integration."""
 
+from dataclasses import fields, is_dataclass
 from typing import Any
 
 from homeassistant.components.diagnostics import async_redact_data
@@ -48,6 +49,18 @@ async def async_get_config_entry_diagnostics(
         "vehicle": async_redact_data(vehicle_data, TO_REDACT_DATA),
         "coordinator": async_redact_data(coordinator_data, TO_REDACT_DATA),
         "store": async_redact_data(store_data, TO_REDACT_STORE),
+        "store_writes": _to_dict(store.write_counters),
+        "api": {
+            "requests": _to_dict(coordinator.api.request_counters),
+            "operations": coordinator.api.request_metrics.as_dict(),
+        },
+        "api_outage": coordinator.api_outage,
+        "staleness": coordinator.get_staleness(),
+        "circuit_breakers": {
+            name: breaker.as_dict()
+            for name, breaker in coordinator.get_circuit_breakers().items()
+        },
+        "traces": coordinator.tracer.as_list(),
     }
 
 
@@ -61,6 +74,14 @@ def _to_dict(obj: Any) -> Any:
     if hasattr(obj, "__iter__") and not isinstance(obj, str):
         return [_to_dict(v) for v in obj]
 
+    # Models keep (some of) their fields in slots, which aren't in __dict__
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {
+            f.name: _to_dict(getattr(obj, f.name))
+            for f in fields(obj)
+            if not f.name.startswith("_")
+        }
+
     if hasattr(obj, "__dict__"):
         return {
             key: _to_dict(value)
@@ -1,5 +1,8 @@
 """Volvo Cars base entity."""
 
+from datetime import datetime
+from typing import Any
+
 from homeassistant.const import CONF_FRIENDLY_NAME, Platform
 from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -44,7 +47,9 @@ class VolvoCarsEntity(CoordinatorEntity[VolvoCarsDataCoordinator]):
         platform: Platform,
     ) -> None:
         """Initialize entity."""
-        super().__init__(coordinator)
+        # The API field is used as context, so the coordinator can notify only
+        # the entities whose data was updated.
+        super().__init__(coordinator, description.api_field)
 
         self.entity_description: VolvoCarsDescription = description
         self.entity_id = get_entity_id(coordinator, platform, description.key)
@@ -52,6 +57,11 @@ class VolvoCarsEntity(CoordinatorEntity[VolvoCarsDataCoordinator]):
         self._attr_device_info = coordinator.device
         self._attr_extra_state_attributes = {}
 
+        # Last report of the car that was written, with the availability
+        self._last_report: (
+            tuple[datetime, Any, str | None, dict[str, Any], bool] | None
+        ) = None
+
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
@@ -62,6 +72,9 @@ class VolvoCarsEntity(CoordinatorEntity[VolvoCarsDataCoordinator]):
         """Handle updated data from the coordinator."""
         api_field = self.coordinator.get_api_field(self.entity_description)
 
+        if self._is_same_report(api_field):
+            return
+
         if isinstance(api_field, VolvoCarsValueField):
             self._attr_extra_state_attributes[ATTR_API_TIMESTAMP] = api_field.timestamp
 
@@ -70,3 +83,23 @@ class VolvoCarsEntity(CoordinatorEntity[VolvoCarsDataCoordinator]):
 
     def _update_state(self, api_field: VolvoCarsApiBaseModel | None) -> None:
         pass
+
+    def _is_same_report(self, api_field: VolvoCarsApiBaseModel | None) -> bool:
+        """Return True if the car didn't report anything new for the field."""
+        if not isinstance(api_field, VolvoCarsValueField) or not api_field.timestamp:
+            self._last_report = None
+            return False
+
+        report = (
+            api_field.timestamp,
+            api_field.value,
+            api_field.unit,
+            api_field.extra_data,
+            self.available,
+        )
+
+        if report == self._last_report:
+            return True
+
+        self._last_report = report
+        return False
@@ -1,16 +1,29 @@
 """Factory methods."""
 
 from collections.abc import Callable
+import logging
+import os
 
 from aiohttp import ClientSession
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+from .const import ENV_API_BASE_URL
 from .data_manager import ApiDataManager
 from .volvo.auth import VolvoCarsAuthApi
 from .volvo.models import TokenResponse
 
+_LOGGER = logging.getLogger(__name__)
+
+
+def get_api_base_url() -> str | None:
+    """Get the base URL of a simulated Volvo API, if one is configured."""
+    if base_url := os.environ.get(ENV_API_BASE_URL):
+        _LOGGER.warning("Using the simulated Volvo API at %s", base_url)
+
+    return base_url or None
+
 
 async def async_create_auth_api(
     hass: HomeAssistant,
@@ -30,4 +43,5 @@ async def async_create_auth_api(
         auth_header=api_data.auth_header,
         default_headers=api_data.default_headers,
         on_token_refresh=on_token_refresh,
+        base_url=get_api_base_url(),
     )
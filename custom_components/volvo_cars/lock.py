@@ -1,6 +1,6 @@
 """Volvo Cars lock."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 import logging
 from typing import Any, cast
@@ -109,6 +109,7 @@ class VolvoCarsLock(VolvoCarsEntity, LockEntity):
                 self._attr_is_unlocking = True
             self.async_write_ha_state()
 
+            self.coordinator.async_wake()
             result = await self.coordinator.api.async_execute_command(command)
             status = result.invoke_status if result else ""
 
@@ -139,10 +140,16 @@ class VolvoCarsLock(VolvoCarsEntity, LockEntity):
 
             if locked:
                 self._attr_is_locking = False
-                api_field.value = self.entity_description.api_lock_value
+                value = self.entity_description.api_lock_value
             else:
                 self._attr_is_unlocking = False
-                api_field.value = self.entity_description.api_unlock_value
+                value = self.entity_description.api_unlock_value
+
+            # Replace the field instead of changing it, so the coordinator
+            # detects the change and notifies the other entities of the field.
+            self.coordinator.data[self.entity_description.api_field] = replace(
+                api_field, value=value
+            )
 
             self._attr_is_locked = locked
             self.async_write_ha_state()
@@ -151,5 +158,5 @@ class VolvoCarsLock(VolvoCarsEntity, LockEntity):
             _LOGGER.debug("Lock '%s' error", command)
             raise HomeAssistantError from ex
         finally:
-            await self.coordinator.async_update_request_count(1)
+            self.coordinator.async_update_request_count(1)
             self.coordinator.async_update_listeners()
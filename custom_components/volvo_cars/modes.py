@@ -0,0 +1,164 @@
+"""Volvo Cars polling modes."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+import time
+from typing import Any
+
+from .volvo.models import VolvoCarsApiBaseModel, VolvoCarsLocation, VolvoCarsValue
+
+# Minimum change in longitude or latitude (in degrees, about 50 m) before the
+# car is considered to be moving. This filters out GPS jitter.
+_MOTION_DISTANCE = 0.0005
+
+# The car is considered asleep when it didn't report anything for this time.
+_DORMANT_AFTER = timedelta(hours=6)
+
+# After waking up, the car can't become dormant again for this time.
+_WAKE_DURATION = 1800
+
+_CONNECTED_STATUSES = (
+    "CONNECTION_STATUS_CONNECTED_AC",
+    "CONNECTION_STATUS_CONNECTED_DC",
+)
+
+
+class PollingMode(StrEnum):
+    """Polling mode of the coordinator."""
+
+    IDLE = "idle"
+    DRIVING = "driving"
+    PLUGGED_IN = "plugged_in"
+    CHARGING = "charging"
+    DORMANT = "dormant"
+
+
+def get_polling_mode(
+    data: Mapping[str, VolvoCarsApiBaseModel | None],
+    in_motion: bool,
+    dormant: bool = False,
+) -> PollingMode:
+    """Determine the polling mode based on the current data."""
+    if in_motion:
+        return PollingMode.DRIVING
+
+    if _get_value(data, "chargingSystemStatus") == "CHARGING_SYSTEM_CHARGING":
+        return PollingMode.CHARGING
+
+    # Only charging keeps a dormant car awake
+    if dormant:
+        return PollingMode.DORMANT
+
+    if _get_value(data, "chargingConnectionStatus") in _CONNECTED_STATUSES:
+        return PollingMode.PLUGGED_IN
+
+    return PollingMode.IDLE
+
+
+def _get_value(
+    data: Mapping[str, VolvoCarsApiBaseModel | None], key: str
+) -> str | None:
+    # The polling modes only depend on status fields, which have string values
+    field = data.get(key)
+
+    if isinstance(field, VolvoCarsValue) and isinstance(field.value, str):
+        return field.value
+
+    return None
+
+
+class MotionDetector:
+    """Detect if the car is driving."""
+
+    def __init__(self) -> None:
+        """Initialize detector."""
+        self._coordinates: list[float] | None = None
+        self._last_motion: float | None = None
+
+    def update(
+        self, data: Mapping[str, VolvoCarsApiBaseModel | None], parked_timeout: float
+    ) -> bool:
+        """Update the detector with new data and return True if in motion.
+
+        The car remains in motion until it has been parked for the given
+        number of seconds.
+        """
+        # Always check the location, so the last known coordinates are tracked
+        has_moved = self._has_moved(data)
+
+        if has_moved or self._is_engine_running(data):
+            self._last_motion = time.monotonic()
+
+        return self.in_motion(parked_timeout)
+
+    def in_motion(self, parked_timeout: float) -> bool:
+        """Return True if the car was moving within the parked timeout."""
+        if self._last_motion is None:
+            return False
+
+        return time.monotonic() - self._last_motion < parked_timeout
+
+    def _is_engine_running(
+        self, data: Mapping[str, VolvoCarsApiBaseModel | None]
+    ) -> bool:
+        return _get_value(data, "engineStatus") == "RUNNING"
+
+    def _has_moved(self, data: Mapping[str, VolvoCarsApiBaseModel | None]) -> bool:
+        location = data.get("location")
+
+        if not isinstance(location, VolvoCarsLocation):
+            return False
+
+        coordinates = location.geometry.coordinates
+
+        if len(coordinates) < 2:
+            return False
+
+        previous = self._coordinates
+        self._coordinates = coordinates
+
+        if previous is None or coordinates is previous:
+            return False
+
+        return any(
+            abs(new - old) >= _MOTION_DISTANCE
+            for new, old in zip(coordinates[:2], previous[:2], strict=True)
+        )
+
+
+class DormancyDetector:
+    """Detect if the car is asleep."""
+
+    def __init__(self) -> None:
+        """Initialize detector."""
+        self._heartbeat: Any = None
+        self._woken_at: float | None = None
+
+    def update(self, heartbeat: Any, last_report: datetime | None) -> bool:
+        """Update the detector and return True if the car is dormant.
+
+        A change of the heartbeat wakes the car up.
+        """
+        if heartbeat is not None:
+            if self._heartbeat is not None and heartbeat != self._heartbeat:
+                self.wake()
+
+            self._heartbeat = heartbeat
+
+        if last_report is None or self._is_awake():
+            return False
+
+        return datetime.now(UTC) - last_report >= _DORMANT_AFTER
+
+    def wake(self) -> None:
+        """Wake up the car."""
+        self._woken_at = time.monotonic()
+
+    def _is_awake(self) -> bool:
+        return (
+            self._woken_at is not None
+            and time.monotonic() - self._woken_at < _WAKE_DURATION
+        )
@@ -53,6 +53,17 @@ async def _set_engine_run_time(
     await coordinator.store.async_update(engine_run_time=value)
 
 
+def _get_parked_timeout(data: StoreData) -> float:
+    return round(data["parked_timeout"])
+
+
+async def _set_parked_timeout(
+    coordinator: VolvoCarsDataCoordinator, value: float
+) -> None:
+    value = round(value)
+    await coordinator.store.async_update(parked_timeout=value)
+
+
 def _engine_run_time_available(coordinator: VolvoCarsDataCoordinator) -> bool:
     return (
         coordinator.vehicle.has_combustion_engine()
@@ -86,6 +97,18 @@ NUMBERS: tuple[VolvoCarsNumberDescription, ...] = (
         available_fn=_engine_run_time_available,
         entity_category=EntityCategory.CONFIG,
     ),
+    VolvoCarsNumberDescription(
+        key="parked_timeout",
+        translation_key="parked_timeout",
+        icon="mdi:car-brake-parking",
+        native_min_value=1,
+        native_max_value=120,
+        native_step=1,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        get_value_fn=_get_parked_timeout,
+        set_value_fn=_set_parked_timeout,
+        entity_category=EntityCategory.CONFIG,
+    ),
 )
 
 
@@ -0,0 +1,65 @@
+"""Volvo Cars API quota governor."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .scheduler import RefreshThrottle
+
+# Part of the budget that is kept aside for commands and manual refreshes.
+_BUDGET_RESERVE = 0.05
+
+
+@dataclass
+class QuotaProjection:
+    """Projected API usage for the current day."""
+
+    budget: int
+    projected: int
+    throttle: RefreshThrottle
+
+    @property
+    def headroom(self) -> int:
+        """Return the number of requests left after the projection."""
+        return self.budget - self.projected
+
+
+class QuotaGovernor:
+    """Keep the daily API requests of an API key within budget."""
+
+    def __init__(self, budget: int) -> None:
+        """Initialize governor."""
+        self.budget = budget
+
+    def evaluate(
+        self, used: int, demand: float, low_priority_demand: float
+    ) -> QuotaProjection:
+        """Determine the throttle to stay within budget for the rest of the day.
+
+        The demand is the number of requests the unthrottled schedule would
+        make until the request counter resets.
+        """
+        available = self.budget * (1 - _BUDGET_RESERVE) - used
+
+        if demand <= available:
+            return self._projection(used, demand, RefreshThrottle())
+
+        if available <= 0:
+            return self._projection(used, 0, RefreshThrottle(pause_all=True))
+
+        # Drop the low priority parts first, then stretch the intervals of the
+        # remaining parts if that is still not enough.
+        pause_low_priority = low_priority_demand > 0
+        demand -= low_priority_demand
+        stretch = max(1.0, demand / available)
+
+        return self._projection(
+            used,
+            demand / stretch,
+            RefreshThrottle(stretch=stretch, pause_low_priority=pause_low_priority),
+        )
+
+    def _projection(
+        self, used: int, demand: float, throttle: RefreshThrottle
+    ) -> QuotaProjection:
+        return QuotaProjection(self.budget, used + round(demand), throttle)
@@ -0,0 +1,252 @@
+"""Volvo Cars refresh scheduler."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
+from datetime import timedelta
+from enum import StrEnum
+import time
+from typing import Any
+
+from .breaker import CircuitBreaker
+from .modes import PollingMode
+
+
+class RefreshCadence(StrEnum):
+    """Cadence class of a refresh part."""
+
+    FAST = "fast"
+    NORMAL = "normal"
+    SLOW = "slow"
+    DAILY = "daily"
+
+
+# Interval per cadence class. FAST follows the data update interval. The data
+# update interval is also the lower limit for the other cadence classes.
+CADENCE_INTERVALS: dict[RefreshCadence, timedelta] = {
+    RefreshCadence.FAST: timedelta(0),
+    RefreshCadence.NORMAL: timedelta(minutes=15),
+    RefreshCadence.SLOW: timedelta(hours=1),
+    RefreshCadence.DAILY: timedelta(hours=6),
+}
+
+# Multiplier for the interval of parts that have no specific cadence for the
+# current polling mode.
+_MODE_BACKOFF: dict[PollingMode, float] = {
+    PollingMode.CHARGING: 2,
+}
+
+# Parts of these cadence classes are paused first when the API quota runs low.
+LOW_PRIORITY_CADENCES = (RefreshCadence.SLOW, RefreshCadence.DAILY)
+
+# Alignment with the reporting cadence of the car never postpones a part for
+# more than this multiple of its interval.
+_MAX_ALIGN_FACTOR = 4
+
+# Parts that are due within this fraction of the data update interval are
+# refreshed together with the parts that are due now.
+_DUE_TOLERANCE = 0.25
+
+
+@dataclass
+class RefreshPart:
+    """Part of the data that is refreshed with a single API call."""
+
+    api_call: Callable[[], Coroutine[Any, Any, Any]]
+    enabled: bool
+    cadence: RefreshCadence
+    mode_cadences: dict[PollingMode, RefreshCadence] = field(
+        default_factory=dict[PollingMode, RefreshCadence]
+    )
+    heartbeat: bool = False
+
+
+@dataclass
+class RefreshThrottle:
+    """Throttle applied to the refresh schedule."""
+
+    stretch: float = 1.0
+    pause_low_priority: bool = False
+    pause_all: bool = False
+
+
+class RefreshScheduler:
+    """Keep track of when each refresh part is due."""
+
+    def __init__(self) -> None:
+        """Initialize scheduler."""
+        self._parts: dict[str, RefreshPart] = {}
+        self._last_refresh: dict[str, float] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._aligned: dict[str, float] = {}
+        self.throttle = RefreshThrottle()
+        self.mode = PollingMode.IDLE
+
+    @property
+    def parts(self) -> dict[str, RefreshPart]:
+        """Return all refresh parts."""
+        return self._parts
+
+    def set_parts(self, parts: dict[str, RefreshPart]) -> None:
+        """Set the refresh parts."""
+        self._parts = parts
+        self._last_refresh = {
+            name: refreshed
+            for name, refreshed in self._last_refresh.items()
+            if name in parts
+        }
+        self._breakers = {
+            name: self._breakers.get(name) or CircuitBreaker() for name in parts
+        }
+        self._aligned = {
+            name: aligned for name, aligned in self._aligned.items() if name in parts
+        }
+
+    @property
+    def breakers(self) -> dict[str, CircuitBreaker]:
+        """Return the circuit breakers of the refresh parts."""
+        return self._breakers
+
+    def get_enabled_parts(self) -> list[str]:
+        """Return the names of the enabled parts."""
+        return [name for name, part in self._parts.items() if part.enabled]
+
+    def get_heartbeats(self) -> list[str]:
+        """Return the names of the heartbeat parts."""
+        return [name for name, part in self._parts.items() if part.heartbeat]
+
+    def is_enabled(self, name: str) -> bool:
+        """Return True if the part exists and is enabled."""
+        part = self._parts.get(name)
+        return part is not None and part.enabled
+
+    def get_interval(self, name: str, base_interval: float) -> float:
+        """Return the throttled refresh interval of a part, in seconds."""
+        return self._get_scheduled_interval(name, base_interval) * self.throttle.stretch
+
+    def get_due_parts(self, base_interval: float) -> list[str]:
+        """Return the names of the scheduled parts that are due."""
+        tolerance = base_interval * _DUE_TOLERANCE
+
+        return [
+            name
+            for name in self._get_scheduled_parts()
+            if self._get_remaining(name, base_interval) <= tolerance
+        ]
+
+    def get_next_delay(self, base_interval: float) -> float:
+        """Return the number of seconds until the next part is due."""
+        remaining = [
+            self._get_remaining(name, base_interval)
+            for name in self._get_scheduled_parts()
+        ]
+
+        if not remaining:
+            return base_interval
+
+        # Never schedule faster than the tolerance, so parts that are almost
+        # due are grouped in a single update.
+        return max(min(remaining), base_interval * _DUE_TOLERANCE)
+
+    def get_request_demand(
+        self, base_interval: float, seconds: float
+    ) -> tuple[float, float]:
+        """Return the unthrottled number of requests in the coming seconds.
+
+        The first value is the total demand, the second value is the part of
+        the demand that comes from low priority parts.
+        """
+        total = 0.0
+        low_priority = 0.0
+
+        for name in self._get_active_parts():
+            requests = seconds / self._get_scheduled_interval(name, base_interval)
+            total += requests
+
+            if self._is_low_priority(name):
+                low_priority += requests
+
+        return total, low_priority
+
+    def mark_refreshed(self, name: str) -> None:
+        """Mark a part as refreshed."""
+        self._last_refresh[name] = time.monotonic()
+        self._breakers[name].record_success()
+
+    def align(self, name: str, delay: float, base_interval: float) -> None:
+        """Postpone a part until the car is expected to report new data.
+
+        Only parts that are not refreshed at the fast pace are postponed.
+        """
+        max_delay = self.get_interval(name, base_interval) * _MAX_ALIGN_FACTOR
+        self._aligned[name] = time.monotonic() + min(delay, max_delay)
+
+    def mark_failed(self, name: str) -> CircuitBreaker:
+        """Mark a part as failed and return its circuit breaker.
+
+        A failed part is retried after its normal interval, or when the
+        backoff of its open circuit has passed.
+        """
+        self._last_refresh[name] = time.monotonic()
+        breaker = self._breakers[name]
+        breaker.record_failure()
+        return breaker
+
+    def get_cadence(self, name: str) -> RefreshCadence:
+        """Return the current cadence class of a part."""
+        part = self._parts[name]
+        return part.mode_cadences.get(self.mode, part.cadence)
+
+    def _get_scheduled_interval(self, name: str, base_interval: float) -> float:
+        cadence_interval = CADENCE_INTERVALS[self.get_cadence(name)]
+        interval = max(base_interval, cadence_interval.total_seconds())
+
+        if self.mode not in self._parts[name].mode_cadences:
+            interval *= _MODE_BACKOFF.get(self.mode, 1)
+
+        return interval
+
+    def _get_scheduled_parts(self) -> list[str]:
+        if self.throttle.pause_all:
+            return []
+
+        return [
+            name
+            for name in self._get_active_parts()
+            if not (self.throttle.pause_low_priority and self._is_low_priority(name))
+        ]
+
+    def _get_active_parts(self) -> list[str]:
+        # While the car is dormant, only the heartbeat is refreshed
+        return [
+            name
+            for name in self.get_enabled_parts()
+            if self.mode != PollingMode.DORMANT or self._parts[name].heartbeat
+        ]
+
+    def _is_low_priority(self, name: str) -> bool:
+        return self.get_cadence(name) in LOW_PRIORITY_CADENCES
+
+    def _get_remaining(self, name: str, base_interval: float) -> float:
+        # A part with an open circuit isn't due before its backoff has passed
+        breaker_remaining = self._breakers[name].get_remaining()
+
+        if (last_refresh := self._last_refresh.get(name)) is None:
+            return breaker_remaining
+
+        now = time.monotonic()
+        remaining = self.get_interval(name, base_interval) - (now - last_refresh)
+
+        if self._is_alignable(name):
+            remaining = max(remaining, self._aligned.get(name, 0) - now)
+
+        return max(remaining, breaker_remaining)
+
+    def _is_alignable(self, name: str) -> bool:
+        # Parts with a specific cadence for the polling mode are never
+        # postponed, because the car behaves differently in that mode.
+        return (
+            self.get_cadence(name) != RefreshCadence.FAST
+            and self.mode not in self._parts[name].mode_cadences
+        )
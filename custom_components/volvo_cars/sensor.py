@@ -22,7 +22,12 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     DATA_BATTERY_CAPACITY,
+    DATA_POLLING_MODE,
     DATA_REQUEST_COUNT,
+    DATA_REQUEST_ERRORS,
+    DATA_REQUEST_HEADROOM,
+    DATA_REQUEST_LATENCY,
+    DATA_REQUEST_PROJECTION,
     OPT_ENERGY_CONSUMPTION_UNIT,
     OPT_FUEL_CONSUMPTION_UNIT,
     OPT_UNIT_ENERGY_KWH_PER_100KM,
@@ -34,6 +39,7 @@ from .const import (
 from .coordinator import VolvoCarsConfigEntry, VolvoCarsDataCoordinator
 from .entity import VolvoCarsEntity, value_to_translation_key
 from .entity_description import VolvoCarsDescription
+from .modes import PollingMode
 from .volvo.models import (
     VolvoCarsApiBaseModel,
     VolvoCarsValue,
@@ -131,6 +137,40 @@ SENSORS: tuple[VolvoCarsSensorDescription, ...] = (
         icon="mdi:counter",
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
+    VolvoCarsSensorDescription(
+        key="api_request_errors",
+        translation_key="api_request_errors",
+        api_field=DATA_REQUEST_ERRORS,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:alert-circle-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    VolvoCarsSensorDescription(
+        key="api_request_headroom",
+        translation_key="api_request_headroom",
+        api_field=DATA_REQUEST_HEADROOM,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:gauge",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    VolvoCarsSensorDescription(
+        key="api_request_latency",
+        translation_key="api_request_latency",
+        api_field=DATA_REQUEST_LATENCY,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:timer-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    VolvoCarsSensorDescription(
+        key="api_request_projection",
+        translation_key="api_request_projection",
+        api_field=DATA_REQUEST_PROJECTION,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:chart-timeline-variant",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
     VolvoCarsSensorDescription(
         key="api_status",
         translation_key="api_status",
@@ -138,6 +178,15 @@ SENSORS: tuple[VolvoCarsSensorDescription, ...] = (
         icon="mdi:api",
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
+    VolvoCarsSensorDescription(
+        key="polling_mode",
+        translation_key="polling_mode",
+        api_field=DATA_POLLING_MODE,
+        device_class=SensorDeviceClass.ENUM,
+        options=[mode.value for mode in PollingMode],
+        icon="mdi:sync",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
     VolvoCarsSensorDescription(
         key="availability",
         translation_key="availability",
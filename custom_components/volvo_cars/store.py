@@ -2,16 +2,42 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TypedDict, Unpack
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 
 from .const import DOMAIN
 
 STORAGE_VERSION = 1
-STORAGE_MINOR_VERSION = 3
+STORAGE_MINOR_VERSION = 4
+
+# Frequent updates (request count, learned cadences, ...) are written after
+# this number of seconds. Updates in the meantime are written together.
+_SAVE_DELAY = 30
+
+
+class StoreCapabilities(TypedDict):
+    """Detected capabilities of the vehicle."""
+
+    commands: list[str]
+    supports_location: bool
+    supports_doors: bool
+    supports_tyres: bool
+    supports_warnings: bool
+    supports_windows: bool
+    unsupported_keys: list[str]
+    updated_at: str
+
+
+class StoreReportingCadence(TypedDict):
+    """Learned reporting cadence of a refresh part."""
+
+    last_report: str
+    interval: float | None
+    samples: int
 
 
 class StoreData(TypedDict, total=False):
@@ -21,8 +47,19 @@ class StoreData(TypedDict, total=False):
     refresh_token: str
     data_update_interval: int
     engine_run_time: int
+    parked_timeout: int
     api_request_count: int
     api_requests_reset_time: str | None
+    capabilities: StoreCapabilities
+    reporting_cadences: dict[str, StoreReportingCadence]
+
+
+@dataclass
+class StoreWriteCounters:
+    """Counters of the writes to the store."""
+
+    written: int = 0
+    coalesced: int = 0
 
 
 class VolvoCarsStore(Store[StoreData]):
@@ -67,6 +104,9 @@ class VolvoCarsStore(Store[StoreData]):
                     api_requests_reset_time=datetime.now(UTC).isoformat(),
                 )
 
+            if old_minor_version < 4:
+                self.merge_data(data, parked_timeout=10)
+
         return data
 
 
@@ -83,6 +123,8 @@ class VolvoCarsStoreManager:
         )
 
         self._data: StoreData | None = None
+        self._save_pending = False
+        self.write_counters = StoreWriteCounters()
 
     @property
     def data(self) -> StoreData:
@@ -92,6 +134,10 @@ class VolvoCarsStoreManager:
 
     async def async_load(self) -> StoreData:
         """Load store data."""
+        if self._save_pending:
+            # The stored data is outdated
+            return self.data
+
         self._data = await self._store.async_load()
 
         if not self._data:
@@ -105,19 +151,48 @@ class VolvoCarsStoreManager:
         self._data = self._data or await self.async_load()
 
         self._store.merge_data(self._data, **kwargs)
+
+        # Saving right away also writes the pending updates
+        self._save_pending = False
+        self.write_counters.written += 1
+
         await self._store.async_save(self._data)
 
+    @callback
+    def async_delay_update(self, **kwargs: Unpack[StoreData]) -> None:
+        """Update the current store with given values and save them later."""
+        self._store.merge_data(self.data, **kwargs)
+
+        if self._save_pending:
+            self.write_counters.coalesced += 1
+            return
+
+        self._save_pending = True
+        self._store.async_delay_save(self._get_pending_data, _SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Save the pending updates now."""
+        if self._save_pending:
+            await self.async_update()
+
     async def async_remove(self) -> None:
         """Remove store data."""
         self._data = None
+        self._save_pending = False
         await self._store.async_remove()
 
+    def _get_pending_data(self) -> StoreData:
+        self._save_pending = False
+        self.write_counters.written += 1
+        return self.data
+
     def _create_default(self) -> StoreData:
         return StoreData(
             access_token="",
             refresh_token="",
             data_update_interval=135,
             engine_run_time=15,
+            parked_timeout=10,
             api_request_count=0,
             api_requests_reset_time=datetime.now(UTC).isoformat(),
         )
@@ -1,6 +1,14 @@
 """Volvo API."""
 
+import asyncio
+from collections.abc import Iterator
+import contextlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import partial
 import logging
+import time
 from typing import Any, cast
 
 from aiohttp import (
@@ -13,6 +21,9 @@ from aiohttp import (
 )
 from yarl import URL
 
+from .cache import VolvoCarsResponseCache
+from .limiter import VolvoCarsRateLimiter
+from .metrics import VolvoCarsRequestMetrics
 from .models import (
     TokenResponse,
     VolvoApiException,
@@ -25,15 +36,20 @@ from .models import (
     VolvoCarsValueField,
     VolvoCarsVehicle,
 )
+from .tracing import span
 from .util import redact_data, redact_url
 
 _API_CONNECTED_ENDPOINT = "/connected-vehicle/v2/vehicles"
 _API_ENERGY_ENDPOINT = "/energy/v1/vehicles"
 _API_LOCATION_ENDPOINT = "/location/v1/vehicles"
 _API_URL = "https://api.volvocars.com"
-_API_STATUS_URL = "https://public-developer-portal-bff.weu-prod.ecpaz.volvocars.biz/api/v1/backend-status"
+_API_STATUS_HOST = "https://public-developer-portal-bff.weu-prod.ecpaz.volvocars.biz"
+_API_STATUS_PATH = "/api/v1/backend-status"
 _API_REQUEST_TIMEOUT = ClientTimeout(total=30)
 
+API_STATUS_OK = "OK"
+API_STATUS_UNKNOWN = "Unknown"
+
 _DATA_TO_REDACT = [
     "coordinates",
     "heading",
@@ -44,14 +60,77 @@ _DATA_TO_REDACT = [
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class VolvoCarsRequestCounters:
+    """Counters of the requests to the Volvo Cars API."""
+
+    sent: int = 0
+    deduplicated: int = 0
+    cached: int = 0
+
+
+@dataclass
+class VolvoCarsRequestCounter:
+    """Number of requests sent within a context."""
+
+    sent: int = 0
+
+
+_REQUEST_COUNTER: ContextVar[VolvoCarsRequestCounter | None] = ContextVar(
+    "volvo_cars_request_counter", default=None
+)
+
+
+@contextmanager
+def count_requests() -> Iterator[VolvoCarsRequestCounter]:
+    """Count the requests that are sent within the context.
+
+    Tasks created within the context count their requests as well, also after
+    the context ended. Requests of other callers of the same API aren't
+    counted, so the counter only holds the requests of the caller.
+    """
+    counter = VolvoCarsRequestCounter()
+    token = _REQUEST_COUNTER.set(counter)
+
+    try:
+        yield counter
+    finally:
+        _REQUEST_COUNTER.reset(token)
+
+
 class VolvoCarsApi:
     """Volvo Cars API."""
 
-    def __init__(self, client: ClientSession, vin: str, api_key: str) -> None:
-        """Initialize Volvo Cars API."""
+    def __init__(
+        self,
+        client: ClientSession,
+        vin: str,
+        api_key: str,
+        cache: VolvoCarsResponseCache | None = None,
+        limiter: VolvoCarsRateLimiter | None = None,
+        *,
+        base_url: str | None = None,
+    ) -> None:
+        """Initialize Volvo Cars API.
+
+        The base URL replaces the hosts of the Volvo API and the API status,
+        for example to use a simulator.
+        """
         self._client = client
+        self._api_url = base_url or _API_URL
+        self._status_url = f"{base_url or _API_STATUS_HOST}{_API_STATUS_PATH}"
         self._vin = vin
         self._api_key = api_key
+        self._cache = cache
+        self._limiter = limiter
+        self._pending: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        self.request_counters = VolvoCarsRequestCounters()
+        self.request_metrics = VolvoCarsRequestMetrics()
+
+    @property
+    def api_key(self) -> str:
+        """Return the API key."""
+        return self._api_key
 
     def update_access_token(self, token: TokenResponse) -> None:
         """Update the access token."""
@@ -62,7 +141,7 @@ class VolvoCarsApi:
         try:
             _LOGGER.debug("Request [API status]")
             async with self._client.get(
-                _API_STATUS_URL, timeout=_API_REQUEST_TIMEOUT
+                self._status_url, timeout=_API_REQUEST_TIMEOUT
             ) as response:
                 _LOGGER.debug("Request [API status] status: %s", response.status)
                 response.raise_for_status()
@@ -70,11 +149,11 @@ class VolvoCarsApi:
                 data = cast(dict[str, Any], json)
                 _LOGGER.debug("Request [API status] response: %s", data)
 
-                message = data.get("message") or "OK"
+                message = data.get("message") or API_STATUS_OK
 
         except (ClientError, TimeoutError) as ex:
             _LOGGER.debug("Request [API status] error: %s", ex)
-            message = "Unknown"
+            message = API_STATUS_UNKNOWN
 
         return {"apiStatus": VolvoCarsValue(message)}
 
@@ -93,7 +172,9 @@ class VolvoCarsApi:
     async def async_get_commands(self) -> list[VolvoCarsAvailableCommand | None]:
         """Get available commands."""
         items = await self._async_get_data_list(_API_CONNECTED_ENDPOINT, "commands")
-        return [VolvoCarsAvailableCommand.from_dict(item) for item in items]
+
+        with span("parse", operation="commands"):
+            return [VolvoCarsAvailableCommand.from_dict(item) for item in items]
 
     async def async_get_diagnostics(self) -> dict[str, VolvoCarsValueField | None]:
         """Get diagnostics."""
@@ -118,7 +199,9 @@ class VolvoCarsApi:
     async def async_get_location(self) -> dict[str, VolvoCarsLocation | None]:
         """Get location."""
         data = await self._async_get_data_dict(_API_LOCATION_ENDPOINT, "location")
-        return {"location": VolvoCarsLocation.from_dict(data)}
+
+        with span("parse", operation="location"):
+            return {"location": VolvoCarsLocation.from_dict(data)}
 
     async def async_get_odometer(self) -> dict[str, VolvoCarsValueField | None]:
         """Get odometer."""
@@ -139,7 +222,9 @@ class VolvoCarsApi:
     async def async_get_vehicle_details(self) -> VolvoCarsVehicle | None:
         """Get vehicle details."""
         data = await self._async_get_data_dict(_API_CONNECTED_ENDPOINT, "")
-        return VolvoCarsVehicle.from_dict(data)
+
+        with span("parse", operation="vehicle"):
+            return VolvoCarsVehicle.from_dict(data)
 
     async def async_get_warnings(self) -> dict[str, VolvoCarsValueField | None]:
         """Get warnings."""
@@ -153,9 +238,15 @@ class VolvoCarsApi:
         self, command: str, body: dict[str, Any] | None = None
     ) -> VolvoCarsCommandResult | None:
         """Execute a command."""
-        body = await self._async_post(
-            _API_CONNECTED_ENDPOINT, f"commands/{command}", body
-        )
+        try:
+            body = await self._async_post(
+                _API_CONNECTED_ENDPOINT, f"commands/{command}", body
+            )
+        finally:
+            # The command may have changed the state of the car
+            if self._cache:
+                self._cache.invalidate()
+
         data: dict = body.get("data", {})
         data["invoke_status"] = data.pop("invokeStatus", None)
         return VolvoCarsCommandResult.from_dict(data)
@@ -165,9 +256,11 @@ class VolvoCarsApi:
     ) -> dict[str, VolvoCarsValueField | None]:
         body = await self._async_get(endpoint, operation)
         data: dict = body.get("data", {})
-        return {
-            key: VolvoCarsValueField.from_dict(value) for key, value in data.items()
-        }
+
+        with span("parse", operation=operation):
+            return {
+                key: VolvoCarsValueField.from_dict(value) for key, value in data.items()
+            }
 
     async def _async_get_data_dict(
         self, endpoint: str, operation: str
@@ -195,10 +288,81 @@ class VolvoCarsApi:
         *,
         body: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
+        if method != hdrs.METH_GET:
+            return await self._async_send(method, endpoint, operation, body=body)
+
+        key = f"{endpoint}/{operation}"
+
+        if self._cache and (data := self._cache.get(key)) is not None:
+            _LOGGER.debug("Request [%s]: using cached response", operation)
+            self.request_counters.cached += 1
+            return data
+
+        # Concurrent callers of the same GET share a single request
+        if (task := self._pending.get(key)) is not None:
+            _LOGGER.debug("Request [%s]: joining pending request", operation)
+            self.request_counters.deduplicated += 1
+        else:
+            task = asyncio.create_task(self._async_send(method, endpoint, operation))
+            task.add_done_callback(
+                partial(
+                    self._request_done,
+                    key,
+                    operation,
+                    self._cache.generation if self._cache else 0,
+                )
+            )
+            self._pending[key] = task
+
+        # Shield the request, so a cancelled caller doesn't cancel it for the
+        # other callers.
+        return await asyncio.shield(task)
+
+    def _request_done(
+        self, key: str, operation: str, generation: int, task: asyncio.Task
+    ) -> None:
+        self._pending.pop(key, None)
+
+        if task.cancelled():
+            return
+
+        # Retrieving the exception also marks it as retrieved, in case all
+        # callers were cancelled.
+        if task.exception() is None and self._cache:
+            self._cache.set(key, operation, task.result(), generation)
+
+    async def _async_send(
+        self,
+        method: str,
+        endpoint: str,
+        operation: str,
+        *,
+        body: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        # The limiter is shared by all cars using the same API key
+        with span("request", method=method, operation=operation):
+            async with self._limiter or contextlib.nullcontext():
+                return await self._async_send_request(
+                    method, endpoint, operation, body=body
+                )
+
+    async def _async_send_request(
+        self,
+        method: str,
+        endpoint: str,
+        operation: str,
+        *,
+        body: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        self.request_counters.sent += 1
+
+        if (counter := _REQUEST_COUNTER.get()) is not None:
+            counter.sent += 1
+
         url = (
-            f"{_API_URL}{endpoint}/{self._vin}/{operation}"
+            f"{self._api_url}{endpoint}/{self._vin}/{operation}"
             if operation
-            else f"{_API_URL}{endpoint}/{self._vin}"
+            else f"{self._api_url}{endpoint}/{self._vin}"
         )
 
         headers = {
@@ -210,6 +374,9 @@ class VolvoCarsApi:
             headers[hdrs.CONTENT_TYPE] = "application/json"
 
         data: dict[str, Any] = {}
+        size = 0
+        error: str | None = None
+        started = time.perf_counter()
 
         try:
             _LOGGER.debug(
@@ -218,23 +385,35 @@ class VolvoCarsApi:
                 method,
                 redact_url(url, self._vin),
             )
-            async with self._client.request(
-                method, url, headers=headers, json=body, timeout=_API_REQUEST_TIMEOUT
-            ) as response:
-                _LOGGER.debug("Request [%s] status: %s", operation, response.status)
-                json = await response.json()
-                data = cast(dict[str, Any], json)
-                _LOGGER.debug(
-                    "Request [%s] response: %s",
-                    operation,
-                    redact_data(data, _DATA_TO_REDACT),
-                )
-                response.raise_for_status()
-                return data
+            with span("http"):
+                async with self._client.request(
+                    method,
+                    url,
+                    headers=headers,
+                    json=body,
+                    timeout=_API_REQUEST_TIMEOUT,
+                ) as response:
+                    _LOGGER.debug("Request [%s] status: %s", operation, response.status)
+                    size = len(await response.read())
+
+                    with span("decode"):
+                        json = await response.json()
+
+                    data = cast(dict[str, Any], json)
+                    _LOGGER.debug(
+                        "Request [%s] response: %s",
+                        operation,
+                        redact_data(data, _DATA_TO_REDACT),
+                    )
+                    response.raise_for_status()
+                    return data
         except ClientResponseError as ex:
+            # Unsupported operations return a 404, which isn't an error
             if ex.status == 404:
                 return {}
 
+            error = str(ex.status)
+
             _LOGGER.debug("Request [%s] error: %s", operation, ex.message)
 
             if ex.status == 422 and "commands" in operation:
@@ -250,10 +429,12 @@ class VolvoCarsApi:
             message = redacted_exception.message
 
             if data and (error_data := data.get("error")):
-                error = VolvoCarsErrorResult.from_dict(error_data)
+                error_result = VolvoCarsErrorResult.from_dict(error_data)
 
-                if error is not None:
-                    message = f"{error.message}. {error.description}".strip()
+                if error_result is not None:
+                    message = (
+                        f"{error_result.message}. {error_result.description}".strip()
+                    )
 
             if ex.status in (401, 403):
                 raise VolvoAuthException(message) from redacted_exception
@@ -261,8 +442,14 @@ class VolvoCarsApi:
             raise VolvoApiException(message) from redacted_exception
 
         except (ClientError, TimeoutError) as ex:
-            _LOGGER.debug("Request [%s] error: %s", operation, ex.__class__.__name__)
-            raise VolvoApiException(ex.__class__.__name__) from ex
+            error = ex.__class__.__name__
+            _LOGGER.debug("Request [%s] error: %s", operation, error)
+            raise VolvoApiException(error) from ex
+
+        finally:
+            self.request_metrics.record(
+                operation or "vehicle", time.perf_counter() - started, size, error
+            )
 
 
 class RedactedClientResponseError(ClientResponseError):
@@ -14,8 +14,9 @@ from .models import (
 )
 from .util import redact_data
 
-_AUTH_URL = "https://volvoid.eu.volvocars.com/as/authorization.oauth2"
-_TOKEN_URL = "https://volvoid.eu.volvocars.com/as/token.oauth2"
+_AUTH_HOST = "https://volvoid.eu.volvocars.com"
+_AUTH_PATH = "/as/authorization.oauth2"
+_TOKEN_PATH = "/as/token.oauth2"
 _SCOPE = [
     "openid",
     "conve:brake_status",
@@ -73,9 +74,15 @@ class VolvoCarsAuthApi:
         auth_header: dict[str, str],
         default_headers: dict[str, str],
         on_token_refresh: Callable[[TokenResponse], None] | None = None,
+        base_url: str | None = None,
     ) -> None:
-        """Initialize Volvo Cars Authentication API."""
+        """Initialize Volvo Cars Authentication API.
+
+        The base URL replaces the host of Volvo ID, for example to use a
+        simulator.
+        """
         self._client = client
+        self._base_url = base_url or _AUTH_HOST
         self._client_id = client_id
         self._default_headers = default_headers
         self._on_token_refresh = on_token_refresh
@@ -144,7 +151,7 @@ class VolvoCarsAuthApi:
 
         return await self._async_request(
             hdrs.METH_POST,
-            _AUTH_URL,
+            f"{self._base_url}{_AUTH_PATH}",
             headers=self._default_headers,
             data=payload,
             name="auth init",
@@ -189,7 +196,7 @@ class VolvoCarsAuthApi:
 
         data = await self._async_request(
             hdrs.METH_POST,
-            _TOKEN_URL,
+            f"{self._base_url}{_TOKEN_PATH}",
             headers=self._all_headers,
             data=payload,
             name="tokens",
@@ -202,7 +209,7 @@ class VolvoCarsAuthApi:
 
         data = await self._async_request(
             hdrs.METH_POST,
-            _TOKEN_URL,
+            f"{self._base_url}{_TOKEN_PATH}",
             headers=self._all_headers,
             data=payload,
             name="token refresh",
@@ -230,7 +237,9 @@ class VolvoCarsAuthApi:
     ) -> dict[str, Any]:
         _LOGGER.debug("Request [%s]", name)
 
-        if url.startswith("http://"):
+        # Links in the responses may use http, while only https is served.
+        # A simulator may only serve http.
+        if url.startswith("http://") and self._base_url.startswith("https://"):
             url = "https://" + url[len("http://") :]
 
         try:
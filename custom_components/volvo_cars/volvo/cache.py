@@ -0,0 +1,70 @@
+"""Volvo API response cache."""
+
+from collections import OrderedDict
+from collections.abc import Mapping
+import time
+from typing import Any
+
+
+class VolvoCarsResponseCache:
+    """Bounded LRU cache of API responses with a time to live per operation."""
+
+    def __init__(
+        self,
+        max_size: int,
+        default_ttl: float,
+        ttls: Mapping[str, float] | None = None,
+    ) -> None:
+        """Initialize cache.
+
+        The time to live is in seconds. Operations with a time to live of 0
+        are never cached.
+        """
+        self._max_size = max_size
+        self._default_ttl = default_ttl
+        self._ttls = ttls or {}
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Return the generation, which changes on every invalidation."""
+        return self._generation
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached response, if it didn't expire yet."""
+        if (entry := self._entries.get(key)) is None:
+            return None
+
+        expires, data = entry
+
+        if time.monotonic() >= expires:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return data
+
+    def set(
+        self, key: str, operation: str, data: dict[str, Any], generation: int
+    ) -> None:
+        """Cache a response.
+
+        Responses of requests that started before the last invalidation are
+        ignored, because they may contain outdated data.
+        """
+        ttl = self._ttls.get(operation, self._default_ttl)
+
+        if ttl <= 0 or generation != self._generation:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, data)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+        self._generation += 1
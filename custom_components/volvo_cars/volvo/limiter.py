@@ -0,0 +1,61 @@
+"""Volvo API rate limiter."""
+
+import asyncio
+import time
+from types import TracebackType
+
+from .tracing import span
+
+
+class VolvoCarsRateLimiter:
+    """Limit the rate and concurrency of API requests.
+
+    The rate is limited with a token bucket, which allows short bursts.
+    """
+
+    def __init__(self, rate: float, burst: int, concurrency: int) -> None:
+        """Initialize rate limiter.
+
+        The rate is the number of requests per second.
+        """
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def __aenter__(self) -> None:
+        """Wait for a free slot and a token."""
+        with span("queue"):
+            await self._semaphore.acquire()
+
+            try:
+                await self._async_take_token()
+            except BaseException:
+                self._semaphore.release()
+                raise
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Release the slot."""
+        self._semaphore.release()
+
+    async def _async_take_token(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._rate)
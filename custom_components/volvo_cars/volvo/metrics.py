@@ -0,0 +1,114 @@
+"""Volvo API request metrics."""
+
+from collections import deque
+import math
+from typing import Any
+
+# Number of recent latencies kept per operation to determine the percentiles.
+_LATENCY_SAMPLES = 200
+
+_PERCENTILES = (50, 95, 99)
+
+
+class VolvoCarsOperationMetrics:
+    """Metrics of the requests of a single API operation."""
+
+    def __init__(self) -> None:
+        """Initialize metrics."""
+        self.requests = 0
+        self.retries = 0
+        self.bytes_received = 0
+        self.errors: dict[str, int] = {}
+        self.latencies: deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+        self._failed = False
+
+    def record(self, latency: float, size: int, error: str | None) -> None:
+        """Record a request.
+
+        The latency is in seconds. The error is the status code or the name
+        of the exception of a failed request. A request that follows a failed
+        request of the same operation is counted as a retry.
+        """
+        self.requests += 1
+        self.bytes_received += size
+        self.latencies.append(latency)
+
+        if self._failed:
+            self.retries += 1
+
+        self._failed = error is not None
+
+        if error is not None:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dictionary."""
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "errors": dict(self.errors),
+            "bytes_received": self.bytes_received,
+            "latency_ms": get_percentiles(self.latencies),
+        }
+
+
+class VolvoCarsRequestMetrics:
+    """Metrics of the requests to the Volvo Cars API, per operation."""
+
+    def __init__(self) -> None:
+        """Initialize metrics."""
+        self._operations: dict[str, VolvoCarsOperationMetrics] = {}
+
+    @property
+    def operations(self) -> dict[str, VolvoCarsOperationMetrics]:
+        """Return the metrics per operation."""
+        return self._operations
+
+    @property
+    def errors(self) -> int:
+        """Return the number of failed requests of all operations."""
+        return sum(
+            sum(metrics.errors.values()) for metrics in self._operations.values()
+        )
+
+    def record(
+        self, operation: str, latency: float, size: int, error: str | None
+    ) -> None:
+        """Record a request of an operation."""
+        if (metrics := self._operations.get(operation)) is None:
+            metrics = self._operations[operation] = VolvoCarsOperationMetrics()
+
+        metrics.record(latency, size, error)
+
+    def get_latency(self, percentile: int) -> float | None:
+        """Return a latency percentile of all operations, in milliseconds."""
+        latencies = [
+            latency
+            for metrics in self._operations.values()
+            for latency in metrics.latencies
+        ]
+        return get_percentiles(latencies, (percentile,))[f"p{percentile}"]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dictionary."""
+        return {
+            operation: metrics.as_dict()
+            for operation, metrics in sorted(self._operations.items())
+        }
+
+
+def get_percentiles(
+    latencies: deque[float] | list[float],
+    percentiles: tuple[int, ...] = _PERCENTILES,
+) -> dict[str, float | None]:
+    """Return the latency percentiles in milliseconds, using the nearest rank."""
+    samples = sorted(latencies)
+
+    return {
+        f"p{percentile}": round(
+            samples[max(0, math.ceil(percentile / 100 * len(samples)) - 1)] * 1000, 1
+        )
+        if samples
+        else None
+        for percentile in percentiles
+    }
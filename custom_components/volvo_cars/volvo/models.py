@@ -1,22 +1,23 @@
 """Volvo API models."""
 
+from collections.abc import Callable
 from dataclasses import KW_ONLY, dataclass, field, is_dataclass
 from datetime import datetime
 import inspect
-import re
-from typing import Any, TypeVar
+import sys
+from typing import Any, TypeVar, cast
 
-T = TypeVar("T", bound="VolvoCarsApiBaseModel")
-_TO_SNAKE_CASE_REGEX = re.compile(r"(?<=[a-z0-9])([A-Z])")
+from .util import parse_timestamp, seed_json_keys, translate_json_key
 
+T = TypeVar("T", bound="VolvoCarsApiBaseModel")
 
-def _sanitize_json_key(key: str) -> str:
-    key = "description" if key == "descriptions" else key
-    key = _TO_SNAKE_CASE_REGEX.sub(r"_\1", key)
-    return key.lower()
+# Fields of which the string values are interned. Their values are mostly
+# enum-like, such as "CLOSED" or "NO_WARNING", and repeat across fields and
+# cars.
+_INTERNED_FIELDS = frozenset({"value", "unit"})
 
 
-@dataclass
+@dataclass(slots=True)
 class VolvoCarsApiBaseModel:
     """Base API model."""
 
@@ -26,26 +27,55 @@ class VolvoCarsApiBaseModel:
     @classmethod
     def from_dict(cls: type[T], data: dict[str, Any]) -> T | None:
         """Create instance from json dict."""
+        if (parser := _PARSERS.get(cls)) is None:
+            parser = _PARSERS[cls] = _ModelParser(cls)
+
+        return cast("T | None", parser.parse(data))
+
+    def get(self, key: str) -> Any:
+        """Get a specific key from the API field."""
+        return self.extra_data.get(key)
+
+
+class _ModelParser:
+    """Parser of a model class.
+
+    The signature of the class is inspected once, instead of for every dict
+    that is parsed.
+    """
+
+    def __init__(self, cls: type[VolvoCarsApiBaseModel]) -> None:
         parameters = inspect.signature(cls).parameters
+
+        self._cls = cls
+        self._fields = frozenset(parameters)
+        seed_json_keys(self._fields)
+
+        # Nested models are parsed with the parser of their own class
+        self._nested: dict[str, Callable[[dict[str, Any]], Any]] = {
+            name: parameter.annotation.from_dict
+            for name, parameter in parameters.items()
+            if is_dataclass(parameter.annotation)
+            and isinstance(parameter.annotation, type)
+            and issubclass(parameter.annotation, VolvoCarsApiBaseModel)
+        }
+
+    def parse(self, data: dict[str, Any]) -> Any:
+        """Create an instance of the class from a json dict."""
         class_data: dict[str, Any] = {}
         extra_data: dict[str, Any] = {}
 
-        for key, value in data.items():
-            key = _sanitize_json_key(key)
-            if key in parameters:
-                # Check if the field is a dataclass and the value is a dict
-                param_type = parameters[key].annotation
-                if (
-                    is_dataclass(param_type)
-                    and isinstance(param_type, type)
-                    and issubclass(param_type, VolvoCarsApiBaseModel)
-                    and isinstance(value, dict)
-                ):
-                    # Recursive call for nested dataclasses
-                    class_data[key] = param_type.from_dict(value)
+        for json_key, value in data.items():
+            key = translate_json_key(json_key)
+
+            if key in self._fields:
+                if (nested := self._nested.get(key)) and isinstance(value, dict):
+                    class_data[key] = nested(value)
                 elif key == "timestamp" and isinstance(value, str):
                     if value:
-                        class_data[key] = datetime.fromisoformat(value)
+                        class_data[key] = parse_timestamp(value)
+                elif key in _INTERNED_FIELDS and isinstance(value, str):
+                    class_data[key] = sys.intern(value)
                 else:
                     class_data[key] = value
             else:
@@ -55,11 +85,10 @@ class VolvoCarsApiBaseModel:
             return None
 
         class_data["extra_data"] = extra_data
-        return cls(**class_data)
+        return self._cls(**class_data)
 
-    def get(self, key: str) -> Any:
-        """Get a specific key from the API field."""
-        return self.extra_data.get(key)
+
+_PARSERS: dict[type[VolvoCarsApiBaseModel], _ModelParser] = {}
 
 
 @dataclass
@@ -101,14 +130,14 @@ class VolvoCarsVehicle(VolvoCarsApiBaseModel):
         return self.fuel_type in ("DIESEL", "PETROL", "PETROL/ELECTRIC")
 
 
-@dataclass
+@dataclass(slots=True)
 class VolvoCarsValue(VolvoCarsApiBaseModel):
     """API value model."""
 
     value: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class VolvoCarsValueField(VolvoCarsValue):
     """API value field model."""
 
@@ -116,14 +145,14 @@ class VolvoCarsValueField(VolvoCarsValue):
     unit: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VolvoCarsGeometry(VolvoCarsApiBaseModel):
     """API geometry model."""
 
     coordinates: list[float] = field(default_factory=list[float])
 
 
-@dataclass
+@dataclass(slots=True)
 class VolvoCarsLocationProperties(VolvoCarsApiBaseModel):
     """API location properties model."""
 
@@ -131,7 +160,7 @@ class VolvoCarsLocationProperties(VolvoCarsApiBaseModel):
     timestamp: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VolvoCarsLocation(VolvoCarsApiBaseModel):
     """API location model."""
 
@@ -0,0 +1,124 @@
+"""Volvo API tracing."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar, Token
+import time
+from types import TracebackType
+from typing import Any
+
+# The span that new spans are added to. It is only set while tracing, so
+# spans outside a trace cost a single lookup and share a no-op context manager.
+_CURRENT_SPAN: ContextVar[Span | None] = ContextVar(
+    "volvo_cars_current_span", default=None
+)
+_NO_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+class Span:
+    """Timed step of a trace."""
+
+    def __init__(self, name: str, attributes: dict[str, Any]) -> None:
+        """Initialize span."""
+        self.name = name
+        self.attributes = attributes
+        self.children: list[Span] = []
+        self.started = time.perf_counter()
+        self.ended: float | None = None
+
+    def as_dict(self, origin: float | None = None) -> dict[str, Any]:
+        """Return the span and its children as a dictionary.
+
+        Times are in milliseconds, relative to the start of the trace.
+        """
+        origin = self.started if origin is None else origin
+
+        return {
+            "name": self.name,
+            **self.attributes,
+            "start_ms": _to_ms(self.started - origin),
+            "duration_ms": None
+            if self.ended is None
+            else _to_ms(self.ended - self.started),
+            "children": [child.as_dict(origin) for child in self.children],
+        }
+
+
+class _ActiveSpan(AbstractContextManager[None]):
+    """Record a span as a child of the given parent."""
+
+    def __init__(self, parent: Span, name: str, attributes: dict[str, Any]) -> None:
+        """Initialize active span."""
+        self._parent = parent
+        self._name = name
+        self._attributes = attributes
+        self._span: Span | None = None
+        self._token: Token[Span | None] | None = None
+
+    def __enter__(self) -> None:
+        """Start the span."""
+        self._span = Span(self._name, self._attributes)
+        self._parent.children.append(self._span)
+        self._token = _CURRENT_SPAN.set(self._span)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """End the span."""
+        if self._span is not None:
+            self._span.ended = time.perf_counter()
+
+        if self._token is not None:
+            _CURRENT_SPAN.reset(self._token)
+
+
+def span(name: str, **attributes: Any) -> AbstractContextManager[None]:
+    """Record a span in the current trace, if any."""
+    if (parent := _CURRENT_SPAN.get()) is None:
+        return _NO_SPAN
+
+    return _ActiveSpan(parent, name, attributes)
+
+
+class VolvoCarsTracer:
+    """Keep the most recent traces in a ring buffer."""
+
+    def __init__(self, max_traces: int, enabled: bool = False) -> None:
+        """Initialize tracer."""
+        self.enabled = enabled
+        self._traces: deque[Span] = deque(maxlen=max_traces)
+
+    @contextmanager
+    def trace(self, name: str, **attributes: Any) -> Iterator[None]:
+        """Record a trace, if tracing is enabled.
+
+        Spans in tasks that are created within the trace, are added to the
+        trace as well.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        root = Span(name, attributes)
+        token = _CURRENT_SPAN.set(root)
+
+        try:
+            yield
+        finally:
+            root.ended = time.perf_counter()
+            _CURRENT_SPAN.reset(token)
+            self._traces.append(root)
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the recorded traces, oldest first."""
+        return [trace.as_dict() for trace in self._traces]
+
+
+def _to_ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
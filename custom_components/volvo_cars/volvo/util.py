@@ -2,11 +2,48 @@
 
 import asyncio
 from collections.abc import Callable, Coroutine, Iterable, Mapping
+from datetime import datetime
+from functools import lru_cache
+import re
 from typing import Any, TypeVar
 
 REDACTED = "**REDACTED**"
 T = TypeVar("T")
 
+# Maximum number of translated JSON keys that are remembered. The API uses a
+# small, fixed set of keys, so in practice every key is translated only once.
+_MAX_TRANSLATED_KEYS = 1024
+_TO_SNAKE_CASE_REGEX = re.compile(r"(?<=[a-z0-9])([A-Z])")
+
+# Maximum number of parsed timestamps that are remembered. The fields of a
+# response mostly share a few timestamps, and a car reports new ones only
+# every few minutes, so this covers the recent responses of large fleets.
+_MAX_PARSED_TIMESTAMPS = 512
+
+
+@lru_cache(maxsize=_MAX_TRANSLATED_KEYS)
+def translate_json_key(key: str) -> str:
+    """Translate a JSON key to the name of a model field."""
+    key = "description" if key == "descriptions" else key
+    key = _TO_SNAKE_CASE_REGEX.sub(r"_\1", key)
+    return key.lower()
+
+
+def seed_json_keys(names: Iterable[str]) -> None:
+    """Translate the JSON keys of the given model field names in advance."""
+    for name in names:
+        first, *others = name.split("_")
+        translate_json_key(first + "".join(other.title() for other in others))
+
+
+@lru_cache(maxsize=_MAX_PARSED_TIMESTAMPS)
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp.
+
+    Identical timestamps are parsed once and share the same datetime.
+    """
+    return datetime.fromisoformat(value)
+
 
 def redact_data(data: Mapping, to_redact: Iterable[Any]) -> dict:
     """Redact sensitive data in a dict."""
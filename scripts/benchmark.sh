@@ -0,0 +1,15 @@
+#!/usr/bin/env bash
+# Runs the benchmarks and compares them with the previous run.
+
+set -e
+
+cd "$(dirname "$0")/.."
+
+# The default options skip the benchmarks
+python -m pytest tests/benchmarks \
+  -o addopts="" \
+  --benchmark-only \
+  --benchmark-autosave \
+  --benchmark-compare \
+  --benchmark-compare-fail=mean:10% \
+  "$@"
@@ -0,0 +1,356 @@
+"""Simulate the Volvo API for load and soak tests.
+
+Serves the connected vehicle, energy, location, Volvo ID and backend status
+routes from the JSON fixtures in tests/fixtures. Point the integration to the
+simulator with the VOLVO_CARS_API_BASE_URL environment variable, for example:
+
+    python -m scripts.simulator --cars 50 --latency lognormal:250:0.5
+    VOLVO_CARS_API_BASE_URL=http://localhost:8765 hass -c config
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import lru_cache
+import json
+import logging
+from pathlib import Path
+import random
+import time
+from typing import Any
+import uuid
+
+from aiohttp import web
+
+FIXTURES_DIR = Path(__file__).parent.parent / "tests" / "fixtures"
+
+# Maps the operations of the API to their fixture.
+_OPERATIONS = {
+    "connected-vehicle": {
+        "brakes": "brakes",
+        "command-accessibility": "availability",
+        "commands": "commands",
+        "diagnostics": "diagnostics",
+        "doors": "doors",
+        "engine": "engine_warnings",
+        "engine-status": "engine_status",
+        "fuel": "fuel_status",
+        "odometer": "odometer",
+        "statistics": "statistics",
+        "tyres": "tyres",
+        "warnings": "warnings",
+        "windows": "windows",
+    },
+    "energy": {"recharge-status": "recharge_status"},
+    "location": {"location": "location"},
+}
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class SimulatorConfig:
+    """Behavior of the simulator."""
+
+    model: str
+    vins: list[str]
+    latency: str
+    error_rate: float
+    auth_burst_interval: float
+    auth_burst_duration: float
+    quota: int
+    report_interval: float
+    status_message: str
+
+
+@dataclass
+class SimulatorStats:
+    """Counters of the handled requests."""
+
+    started: float = field(default_factory=time.monotonic)
+    requests: Counter[str] = field(default_factory=Counter)
+    responses: Counter[int] = field(default_factory=Counter)
+    quota_used: Counter[str] = field(default_factory=Counter)
+    quota_day: str = ""
+
+
+@lru_cache
+def _load_fixture(name: str, model: str) -> Any:
+    path = FIXTURES_DIR.joinpath(model, f"{name}.json")
+
+    if not path.exists():
+        path = FIXTURES_DIR.joinpath(f"{name}.json")
+
+    with path.open(encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _create_vins(count: int) -> list[str]:
+    return [f"YV1SIM{serial:011d}" for serial in range(count)]
+
+
+def _get_latency(distribution: str) -> float:
+    """Return a latency in seconds.
+
+    Distributions are given in milliseconds: fixed:<ms>, uniform:<min>:<max>,
+    normal:<mean>:<stddev> or lognormal:<median>:<sigma>.
+    """
+    kind, *args = distribution.split(":")
+    values = [float(arg) for arg in args]
+
+    if kind == "fixed":
+        latency = values[0]
+    elif kind == "uniform":
+        latency = random.uniform(values[0], values[1])
+    elif kind == "normal":
+        latency = random.gauss(values[0], values[1])
+    elif kind == "lognormal":
+        latency = values[0] * random.lognormvariate(0, values[1])
+    else:
+        raise ValueError(f"Unknown latency distribution: {distribution}")
+
+    return max(0.0, latency) / 1000
+
+
+def _error(status: int, message: str, description: str = "") -> web.Response:
+    return web.json_response(
+        {"error": {"message": message, "description": description}}, status=status
+    )
+
+
+class VolvoApiSimulator:
+    """Serve the Volvo API routes from fixtures."""
+
+    def __init__(self, config: SimulatorConfig) -> None:
+        """Initialize simulator."""
+        self._config = config
+        self._vins = set(config.vins)
+        self._stats = SimulatorStats()
+
+    def create_app(self) -> web.Application:
+        """Create the web application."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/api/v1/backend-status", self._handle_status)
+        app.router.add_post("/as/authorization.oauth2", self._handle_authorize)
+        app.router.add_post("/as/token.oauth2", self._handle_token)
+        app.router.add_get("/simulator/stats", self._handle_stats)
+        app.router.add_get("/connected-vehicle/v2/vehicles/{vin}", self._handle_vehicle)
+        app.router.add_post(
+            "/connected-vehicle/v2/vehicles/{vin}/commands/{command}",
+            self._handle_command,
+        )
+        app.router.add_get(
+            "/{api}/{version}/vehicles/{vin}/{operation}", self._handle_get
+        )
+        return app
+
+    @web.middleware
+    async def _middleware(
+        self, request: web.Request, handler: Any
+    ) -> web.StreamResponse:
+        resource = request.match_info.route.resource
+        self._stats.requests[resource.canonical if resource else request.path] += 1
+        await _async_sleep(_get_latency(self._config.latency))
+
+        if request.path.startswith(("/connected-vehicle", "/energy", "/location")):
+            if (response := self._check_request(request)) is not None:
+                self._stats.responses[response.status] += 1
+                return response
+
+        response = await handler(request)
+        self._stats.responses[response.status] += 1
+        return response
+
+    def _check_request(self, request: web.Request) -> web.Response | None:
+        if request.match_info.get("vin") not in self._vins:
+            return _error(404, "Not found", "Unknown VIN")
+
+        authorization = request.headers.get("Authorization", "")
+
+        if not authorization.startswith("Bearer ") or self._in_auth_burst():
+            return _error(401, "Unauthorized", "The access token is invalid")
+
+        api_key = request.headers.get("vcc-api-key", "")
+
+        if not api_key:
+            return _error(401, "Unauthorized", "Missing API key")
+
+        if self._config.quota and not self._use_quota(api_key):
+            return _error(429, "Too many requests", "The daily quota is exceeded")
+
+        if random.random() < self._config.error_rate:
+            return _error(500, "Internal server error", "Simulated error")
+
+        return None
+
+    def _in_auth_burst(self) -> bool:
+        if self._config.auth_burst_interval <= 0:
+            return False
+
+        # Each interval ends with a burst, so the integration can start first
+        interval = self._config.auth_burst_interval
+        elapsed = time.monotonic() - self._stats.started
+        return elapsed % interval >= interval - self._config.auth_burst_duration
+
+    def _use_quota(self, api_key: str) -> bool:
+        day = datetime.now(UTC).date().isoformat()
+
+        if day != self._stats.quota_day:
+            self._stats.quota_day = day
+            self._stats.quota_used.clear()
+
+        self._stats.quota_used[api_key] += 1
+        return self._stats.quota_used[api_key] <= self._config.quota
+
+    def _with_timestamps(self, data: Any) -> Any:
+        """Replace the timestamps, as if the car reported at its interval."""
+        if self._config.report_interval <= 0:
+            return data
+
+        now = time.time()
+        reported = now - now % self._config.report_interval
+        timestamp = datetime.fromtimestamp(reported, UTC).isoformat()
+
+        def _replace(value: Any) -> Any:
+            if isinstance(value, dict):
+                return {
+                    key: timestamp if key == "timestamp" else _replace(item)
+                    for key, item in value.items()
+                }
+
+            if isinstance(value, list):
+                return [_replace(item) for item in value]
+
+            return value
+
+        return _replace(data)
+
+    async def _handle_status(self, request: web.Request) -> web.Response:
+        return web.json_response({"message": self._config.status_message})
+
+    async def _handle_authorize(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"status": "COMPLETED", "authorizeResponse": {"code": uuid.uuid4().hex}}
+        )
+
+    async def _handle_token(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "access_token": uuid.uuid4().hex,
+                "refresh_token": uuid.uuid4().hex,
+                "token_type": "Bearer",
+                "expires_in": 1799,
+                "id_token": uuid.uuid4().hex,
+            }
+        )
+
+    async def _handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "uptime": round(time.monotonic() - self._stats.started),
+                "requests": dict(self._stats.requests),
+                "responses": {
+                    str(status): count
+                    for status, count in self._stats.responses.items()
+                },
+                "quota_used": dict(self._stats.quota_used),
+            }
+        )
+
+    async def _handle_vehicle(self, request: web.Request) -> web.Response:
+        data = _load_fixture("vehicle", self._config.model)
+        return web.json_response({"data": data | {"vin": request.match_info["vin"]}})
+
+    async def _handle_command(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "data": {
+                    "vin": request.match_info["vin"],
+                    "invokeStatus": "COMPLETED",
+                    "message": "",
+                }
+            }
+        )
+
+    async def _handle_get(self, request: web.Request) -> web.Response:
+        operations = _OPERATIONS.get(request.match_info["api"], {})
+
+        if (name := operations.get(request.match_info["operation"])) is None:
+            return _error(404, "Not found", "Unknown operation")
+
+        data = _load_fixture(name, self._config.model)
+
+        # The commands fixture is a complete response
+        body = data if name == "commands" else {"data": data}
+        return web.json_response(self._with_timestamps(body))
+
+
+async def _async_sleep(seconds: float) -> None:
+    if seconds > 0:
+        await asyncio.sleep(seconds)
+
+
+def main() -> None:
+    """Run the simulator."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cars", type=int, default=1, help="number of simulated VINs")
+    parser.add_argument("--model", default="xc40_bev", help="fixture model")
+    parser.add_argument(
+        "--latency",
+        default="fixed:0",
+        help="fixed:<ms>, uniform:<min>:<max>, normal:<mean>:<stddev> "
+        "or lognormal:<median>:<sigma>",
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="fraction of requests with a 500"
+    )
+    parser.add_argument(
+        "--auth-burst-interval",
+        type=float,
+        default=0.0,
+        help="seconds between bursts of 401 responses, 0 to disable",
+    )
+    parser.add_argument(
+        "--auth-burst-duration", type=float, default=30.0, help="seconds per burst"
+    )
+    parser.add_argument(
+        "--quota", type=int, default=0, help="requests per API key per day, 0 for none"
+    )
+    parser.add_argument(
+        "--report-interval",
+        type=float,
+        default=0.0,
+        help="seconds between simulated car reports, 0 to keep fixture timestamps",
+    )
+    parser.add_argument(
+        "--status-message", default="", help="backend status message, empty for OK"
+    )
+    args = parser.parse_args()
+
+    # Validate the distribution before starting
+    _get_latency(args.latency)
+
+    config = SimulatorConfig(
+        model=args.model,
+        vins=_create_vins(args.cars),
+        latency=args.latency,
+        error_rate=args.error_rate,
+        auth_burst_interval=args.auth_burst_interval,
+        auth_burst_duration=args.auth_burst_duration,
+        quota=args.quota,
+        report_interval=args.report_interval,
+        status_message=args.status_message,
+    )
+
+    logging.basicConfig(level=logging.INFO)
+    _LOGGER.info("Simulated VINs: %s", ", ".join(config.vins))
+
+    web.run_app(VolvoApiSimulator(config).create_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark fixtures for Volvo Cars."""
+
+from dataclasses import replace
+from itertools import count
+
+from _pytest.fixtures import SubRequest
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components import volvo_cars
+from custom_components.volvo_cars.const import CONF_VCC_API_KEY, CONF_VIN, DOMAIN
+from custom_components.volvo_cars.coordinator import VolvoCarsDataCoordinator
+from custom_components.volvo_cars.store import VolvoCarsStoreManager
+from custom_components.volvo_cars.volvo.models import VolvoCarsVehicle
+from homeassistant.const import CONF_FRIENDLY_NAME, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+
+@pytest.fixture
+async def fleet(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_image_client: None,
+    request: SubRequest,
+) -> list[VolvoCarsDataCoordinator]:
+    """Set up the given number of cars and return their coordinators."""
+
+    # Every car needs its own VIN, otherwise their entities would collide
+    api = volvo_cars.VolvoCarsApi.return_value
+    vehicle: VolvoCarsVehicle = api.async_get_vehicle_details.return_value
+    serials = count()
+    api.async_get_vehicle_details.side_effect = lambda: replace(
+        vehicle, vin=_vin(next(serials))
+    )
+
+    entries: list[MockConfigEntry] = []
+
+    for serial in range(request.param):
+        vin = _vin(serial)
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            unique_id=vin,
+            data={
+                CONF_USERNAME: "john@doe.com",
+                CONF_VIN: vin,
+                CONF_VCC_API_KEY: "abcdefghij0123456789",
+                CONF_FRIENDLY_NAME: f"myvolvo{serial}",
+            },
+        )
+
+        store = VolvoCarsStoreManager(hass, vin)
+        await store.async_update()
+
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        entries.append(entry)
+
+    await hass.async_block_till_done()
+    return [entry.runtime_data.coordinator for entry in entries]
+
+
+def _vin(serial: int) -> str:
+    return f"YV1ABCDEFG{serial:07d}"
@@ -0,0 +1,63 @@
+"""Benchmark Volvo Cars coordinator."""
+
+from dataclasses import replace
+from datetime import timedelta
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from custom_components.volvo_cars.coordinator import (
+    CoordinatorData,
+    VolvoCarsDataCoordinator,
+)
+from custom_components.volvo_cars.volvo.models import VolvoCarsValueField
+from homeassistant.core import HomeAssistant
+
+# The benchmarks are synchronous, so they can run the event loop themselves.
+
+
+@pytest.mark.parametrize("fleet", [1], indirect=True)
+def test_update_cycle(
+    benchmark: BenchmarkFixture,
+    hass: HomeAssistant,
+    fleet: list[VolvoCarsDataCoordinator],
+) -> None:
+    """Benchmark a refresh of all data with a mocked API."""
+
+    coordinator = fleet[0]
+
+    benchmark(lambda: hass.loop.run_until_complete(coordinator.async_full_refresh()))
+
+
+@pytest.mark.parametrize("fleet", [1, 10, 100], indirect=True)
+def test_entity_dispatch(
+    benchmark: BenchmarkFixture,
+    hass: HomeAssistant,
+    fleet: list[VolvoCarsDataCoordinator],
+) -> None:
+    """Benchmark notifying the entities of all cars of new data."""
+
+    # Alternate between two versions of the data, so every field changes
+    versions = [
+        (coordinator, [coordinator.data, _get_newer_data(coordinator.data)])
+        for coordinator in fleet
+    ]
+    rounds = 0
+
+    async def _async_dispatch() -> None:
+        nonlocal rounds
+        rounds += 1
+
+        for coordinator, data in versions:
+            coordinator.async_set_updated_data(data[rounds % 2])
+
+    benchmark(lambda: hass.loop.run_until_complete(_async_dispatch()))
+
+
+def _get_newer_data(data: CoordinatorData) -> CoordinatorData:
+    return {
+        key: replace(value, timestamp=value.timestamp + timedelta(seconds=1))
+        if isinstance(value, VolvoCarsValueField) and value.timestamp
+        else value
+        for key, value in data.items()
+    }
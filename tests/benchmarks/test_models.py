@@ -0,0 +1,73 @@
+"""Benchmark Volvo Cars API models."""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from custom_components.volvo_cars.volvo.api import _DATA_TO_REDACT
+from custom_components.volvo_cars.volvo.models import (
+    VolvoCarsAvailableCommand,
+    VolvoCarsLocation,
+    VolvoCarsValueField,
+    VolvoCarsVehicle,
+)
+from custom_components.volvo_cars.volvo.util import redact_data
+from tests.common import load_json_object_fixture
+
+_MODELS = ["xc40_bev", "ex30_bev", "s90_diesel", "xc90_ice"]
+_FIELDS = [
+    "availability",
+    "brakes",
+    "diagnostics",
+    "doors",
+    "engine_status",
+    "engine_warnings",
+    "fuel_status",
+    "odometer",
+    "recharge_status",
+    "statistics",
+    "tyres",
+    "warnings",
+    "windows",
+]
+
+
+def _load_responses(model: str) -> dict[str, dict]:
+    responses = {
+        name: {"data": load_json_object_fixture(name, model)}
+        for name in ("vehicle", "location", *_FIELDS)
+    }
+    responses["commands"] = dict(load_json_object_fixture("commands", model))
+    return responses
+
+
+@pytest.mark.parametrize("model", _MODELS)
+def test_from_dict(benchmark: BenchmarkFixture, model: str) -> None:
+    """Benchmark parsing all responses of a car."""
+
+    responses = _load_responses(model)
+
+    def _parse() -> None:
+        VolvoCarsVehicle.from_dict(responses["vehicle"]["data"])
+        VolvoCarsLocation.from_dict(responses["location"]["data"])
+
+        for item in responses["commands"]["data"]:
+            VolvoCarsAvailableCommand.from_dict(item)
+
+        for name in _FIELDS:
+            for value in responses[name]["data"].values():
+                VolvoCarsValueField.from_dict(value)
+
+    benchmark(_parse)
+
+
+@pytest.mark.parametrize("model", _MODELS)
+def test_redact_data(benchmark: BenchmarkFixture, model: str) -> None:
+    """Benchmark redacting all responses of a car."""
+
+    responses = list(_load_responses(model).values())
+
+    def _redact() -> None:
+        for response in responses:
+            redact_data(response, _DATA_TO_REDACT)
+
+    benchmark(_redact)
@@ -12,7 +12,9 @@ from custom_components.volvo_cars.const import CONF_VCC_API_KEY, CONF_VIN, DOMAI
 from custom_components.volvo_cars.coordinator import VolvoCarsData
 from custom_components.volvo_cars.data_manager import ApiData, ApiDataManager
 from custom_components.volvo_cars.store import VolvoCarsStoreManager
+from custom_components.volvo_cars.volvo.api import VolvoCarsRequestCounters
 from custom_components.volvo_cars.volvo.auth import VolvoCarsAuthApi
+from custom_components.volvo_cars.volvo.metrics import VolvoCarsRequestMetrics
 from custom_components.volvo_cars.volvo.models import (
     AuthorizationModel,
     TokenResponse,
@@ -90,6 +92,8 @@ async def mock_api(request: SubRequest) -> AsyncGenerator[None, None]:
         windows = _get_json_as_value_field("windows", model)
 
         api = mock_api.return_value
+        api.request_counters = VolvoCarsRequestCounters()
+        api.request_metrics = VolvoCarsRequestMetrics()
         api.async_get_api_status = AsyncMock(
             return_value={"apiStatus": VolvoCarsValue("OK")}
         )
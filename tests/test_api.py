@@ -0,0 +1,198 @@
+"""Test Volvo Cars API."""
+
+import asyncio
+
+import pytest
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from custom_components.volvo_cars.volvo.api import VolvoCarsApi, count_requests
+from custom_components.volvo_cars.volvo.cache import VolvoCarsResponseCache
+from custom_components.volvo_cars.volvo.models import (
+    TokenResponse,
+    VolvoApiException,
+    VolvoAuthException,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .common import load_json_object_fixture
+
+_VIN = "YV1ABCDEFG1234567"
+_VEHICLE_URL = f"https://api.volvocars.com/connected-vehicle/v2/vehicles/{_VIN}"
+_DOORS_URL = f"{_VEHICLE_URL}/doors"
+
+
+def _create_api(
+    hass: HomeAssistant,
+    *,
+    cache: VolvoCarsResponseCache | None = None,
+    base_url: str | None = None,
+) -> VolvoCarsApi:
+    # The session of Home Assistant is closed when the test ends
+    api = VolvoCarsApi(
+        async_get_clientsession(hass), _VIN, "key", cache, base_url=base_url
+    )
+    api.update_access_token(
+        TokenResponse(
+            access_token="",
+            refresh_token="",
+            token_type="Bearer",
+            expires_in=1799,
+            id_token="",
+        )
+    )
+    return api
+
+
+async def test_concurrent_get_deduplicated(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test if concurrent identical GET requests share a single request."""
+
+    aioclient_mock.get(_DOORS_URL, json={"data": load_json_object_fixture("doors")})
+    api = _create_api(hass)
+
+    first, second = await asyncio.gather(
+        api.async_get_doors_status(), api.async_get_doors_status()
+    )
+
+    assert aioclient_mock.call_count == 1
+    assert first == second
+    assert api.request_counters.sent == 1
+    assert api.request_counters.deduplicated == 1
+
+
+async def test_sequential_get_not_deduplicated(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test if sequential GET requests are sent separately."""
+
+    aioclient_mock.get(_DOORS_URL, json={"data": load_json_object_fixture("doors")})
+    api = _create_api(hass)
+
+    await api.async_get_doors_status()
+    await api.async_get_doors_status()
+
+    assert aioclient_mock.call_count == 2
+    assert api.request_counters.deduplicated == 0
+
+
+async def test_count_requests(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test if only the requests of the counting caller are counted."""
+
+    aioclient_mock.get(_DOORS_URL, json={"data": load_json_object_fixture("doors")})
+    aioclient_mock.post(
+        f"{_VEHICLE_URL}/commands/lock",
+        json={"data": {"vin": _VIN, "invokeStatus": "COMPLETED", "message": ""}},
+    )
+    api = _create_api(hass)
+
+    with count_requests() as counter:
+        doors = asyncio.create_task(api.async_get_doors_status())
+
+    await asyncio.gather(doors, api.async_execute_command("lock"))
+
+    assert counter.sent == 1
+    assert api.request_counters.sent == 2
+
+
+async def test_cached_get(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test if repeated GET requests are served from the cache."""
+
+    aioclient_mock.get(_DOORS_URL, json={"data": load_json_object_fixture("doors")})
+    api = _create_api(hass, cache=VolvoCarsResponseCache(8, 60))
+
+    first = await api.async_get_doors_status()
+    second = await api.async_get_doors_status()
+
+    assert aioclient_mock.call_count == 1
+    assert first == second
+    assert api.request_counters.cached == 1
+
+
+async def test_cache_invalidated_by_command(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test if a command invalidates the cache."""
+
+    aioclient_mock.get(_DOORS_URL, json={"data": load_json_object_fixture("doors")})
+    aioclient_mock.post(
+        f"{_VEHICLE_URL}/commands/lock",
+        json={"data": {"vin": _VIN, "invokeStatus": "COMPLETED", "message": ""}},
+    )
+    api = _create_api(hass, cache=VolvoCarsResponseCache(8, 60))
+
+    await api.async_get_doors_status()
+    await api.async_execute_command("lock")
+    await api.async_get_doors_status()
+
+    assert aioclient_mock.call_count == 3
+    assert api.request_counters.cached == 0
+
+
+async def test_request_metrics(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test if requests are recorded per operation."""
+
+    aioclient_mock.get(_DOORS_URL, json={"data": load_json_object_fixture("doors")})
+    aioclient_mock.get(f"{_VEHICLE_URL}/brakes", status=500, json={})
+    api = _create_api(hass)
+
+    await api.async_get_doors_status()
+
+    with pytest.raises(VolvoApiException):
+        await api.async_get_brakes_status()
+
+    doors = api.request_metrics.operations["doors"]
+    assert doors.requests == 1
+    assert doors.bytes_received > 0
+    assert not doors.errors
+
+    assert api.request_metrics.operations["brakes"].errors == {"500": 1}
+    assert api.request_metrics.errors == 1
+    assert api.request_metrics.get_latency(95) is not None
+
+
+async def test_error_response(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test if error responses raise the API exceptions."""
+
+    aioclient_mock.get(
+        _DOORS_URL,
+        status=401,
+        json={"error": {"message": "Unauthorized", "description": "Expired"}},
+    )
+    aioclient_mock.get(f"{_VEHICLE_URL}/tyres", status=404, json={})
+    api = _create_api(hass)
+
+    with pytest.raises(VolvoAuthException, match="Unauthorized. Expired"):
+        await api.async_get_doors_status()
+
+    # Unsupported operations aren't errors
+    assert await api.async_get_tyre_states() == {}
+    assert api.request_metrics.operations["doors"].errors == {"401": 1}
+    assert not api.request_metrics.operations["tyres"].errors
+
+
+async def test_base_url(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test if the base URL replaces the hosts of the API."""
+
+    base_url = "http://localhost:8765"
+    aioclient_mock.get(
+        f"{base_url}/connected-vehicle/v2/vehicles/{_VIN}/doors",
+        json={"data": load_json_object_fixture("doors")},
+    )
+    aioclient_mock.get(f"{base_url}/api/v1/backend-status", json={})
+
+    api = _create_api(hass, base_url=base_url)
+
+    assert await api.async_get_doors_status()
+    assert (await api.async_get_api_status())["apiStatus"].value == "OK"
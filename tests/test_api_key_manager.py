@@ -0,0 +1,89 @@
+"""Test Volvo Cars API key manager."""
+
+import asyncio
+
+from custom_components.volvo_cars.api_key_manager import ApiKeyManager
+from custom_components.volvo_cars.volvo.limiter import VolvoCarsRateLimiter
+
+
+def test_phases() -> None:
+    """Test if the entries sharing an API key are spread over the interval."""
+
+    manager = ApiKeyManager()
+    unregister = manager.async_register("key", "entry_1")
+
+    assert manager.get_phase("key", "entry_1", 120) is None
+
+    manager.async_register("key", "entry_2")
+    manager.async_register("key", "entry_3")
+    manager.async_register("other_key", "entry_4")
+
+    assert manager.get_phase("key", "entry_1", 120) == 0
+    assert manager.get_phase("key", "entry_2", 120) == 40
+    assert manager.get_phase("key", "entry_3", 120) == 80
+
+    unregister()
+
+    assert manager.get_phase("key", "entry_3", 120) == 60
+
+
+def test_shared_budget() -> None:
+    """Test if the lowest budget of the entries sharing an API key applies."""
+
+    manager = ApiKeyManager()
+    unregister = manager.async_register("key", "entry_1", 5000)
+    manager.async_register("key", "entry_2", 8000)
+    manager.async_register("other_key", "entry_3", 1000)
+
+    assert manager.get_budget("key") == 5000
+    assert manager.get_budget("other_key") == 1000
+
+    unregister()
+
+    assert manager.get_budget("key") == 8000
+    assert manager.get_budget("unknown_key") is None
+
+
+def test_shared_limiter() -> None:
+    """Test if entries sharing an API key share the limiter."""
+
+    manager = ApiKeyManager()
+
+    assert manager.get_limiter("key") is manager.get_limiter("key")
+    assert manager.get_limiter("key") is not manager.get_limiter("other_key")
+
+
+async def test_concurrency_cap() -> None:
+    """Test if the limiter caps the number of concurrent requests."""
+
+    limiter = VolvoCarsRateLimiter(rate=1000, burst=100, concurrency=2)
+    active = 0
+    max_active = 0
+
+    async def _request() -> None:
+        nonlocal active, max_active
+
+        async with limiter:
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(_request() for _ in range(6)))
+
+    assert max_active == 2
+
+
+async def test_rate_limit() -> None:
+    """Test if requests beyond the burst wait for a token."""
+
+    limiter = VolvoCarsRateLimiter(rate=20, burst=2, concurrency=10)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    for _ in range(4):
+        async with limiter:
+            pass
+
+    # Two requests from the burst, two more at 20 per second
+    assert loop.time() - start >= 0.09
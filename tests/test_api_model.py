@@ -1,6 +1,8 @@
 """Test Volvo API models."""
 
+from copy import deepcopy
 from datetime import UTC, datetime
+import json
 
 import pytest
 
@@ -104,3 +106,52 @@ def test_error_parsing(has_description: bool) -> None:
         assert error.description == description
     else:
         assert error.description is None
+
+
+def test_extra_data() -> None:
+    """Test if unknown keys end up in the extra data."""
+
+    field = VolvoCarsValueField.from_dict(
+        {"value": "OPEN", "unavailableReason": "car_in_use", "timestamp": ""}
+    )
+
+    assert field
+    assert field.value == "OPEN"
+    assert field.timestamp is None
+    assert field.extra_data == {"unavailable_reason": "car_in_use"}
+    assert field.get("unavailable_reason") == "car_in_use"
+
+    # Without known keys, nothing is created
+    assert VolvoCarsValueField.from_dict({"unavailableReason": "car_in_use"}) is None
+
+
+def test_compact_value_fields() -> None:
+    """Test if value fields share their repeated values."""
+
+    # Each decoded response holds its own copy of the repeated values
+    fields = [
+        VolvoCarsValueField.from_dict(json.loads('{"value": "CLOSED"}'))
+        for _ in range(2)
+    ]
+
+    assert fields[0]
+    assert fields[1]
+    assert fields[0].value is fields[1].value
+    assert fields[0].extra_data == {}
+    assert fields[0].extra_data is not fields[1].extra_data
+    assert fields[0].get("unavailable_reason") is None
+    assert not hasattr(fields[0], "__dict__")
+
+
+def test_deepcopy_model() -> None:
+    """Test if a parsed model can be deep copied."""
+
+    location = VolvoCarsLocation.from_dict(load_json_object_fixture("location"))
+    assert location
+
+    location.extra_data["new"] = True
+    copied = deepcopy(location)
+
+    assert copied == location
+    assert copied.extra_data is not location.extra_data
+    assert copied.properties.extra_data is not location.properties.extra_data
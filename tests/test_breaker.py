@@ -0,0 +1,49 @@
+"""Test Volvo Cars circuit breaker."""
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+
+from custom_components.volvo_cars.breaker import CircuitBreaker, CircuitState
+
+
+def test_opens_after_threshold() -> None:
+    """Test if the circuit opens after consecutive failures."""
+
+    breaker = CircuitBreaker()
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.get_remaining() > 0
+
+
+def test_half_open_probe(freezer: FrozenDateTimeFactory) -> None:
+    """Test if the circuit becomes half-open and backs off exponentially."""
+
+    breaker = CircuitBreaker()
+
+    for _ in range(3):
+        breaker.record_failure()
+
+    backoff = breaker.backoff
+    freezer.tick(timedelta(seconds=backoff))
+
+    assert breaker.state == CircuitState.HALF_OPEN
+
+    # Failed probe
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.backoff == backoff * 2
+
+    # Successful probe
+    freezer.tick(timedelta(seconds=breaker.backoff))
+    breaker.record_success()
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failures == 0
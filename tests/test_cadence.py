@@ -0,0 +1,49 @@
+"""Test Volvo Cars reporting cadence."""
+
+from datetime import UTC, datetime, timedelta
+
+from custom_components.volvo_cars.cadence import CadenceLearner
+from custom_components.volvo_cars.volvo.models import VolvoCarsValueField
+
+_START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _report(hours: float) -> dict[str, VolvoCarsValueField | None]:
+    return {
+        "odometer": VolvoCarsValueField(
+            value=1000, timestamp=_START + timedelta(hours=hours)
+        )
+    }
+
+
+def test_learn_cadence() -> None:
+    """Test if the cadence is learned from new reports."""
+
+    learner = CadenceLearner()
+
+    assert learner.update("odometer", _report(0))
+    assert not learner.update("odometer", _report(0))
+
+    for hours in (2, 4):
+        assert learner.update("odometer", _report(hours))
+
+    # Not enough samples yet
+    assert learner.get_delay("odometer", _START + timedelta(hours=4)) == 0
+
+    assert learner.update("odometer", _report(6))
+
+    delay = learner.get_delay("odometer", _START + timedelta(hours=6))
+    assert delay == timedelta(hours=1).total_seconds()
+
+
+def test_store_cadence() -> None:
+    """Test if the learned cadence survives a round trip to the store."""
+
+    learner = CadenceLearner()
+
+    for hours in (0, 2, 4, 6):
+        learner.update("odometer", _report(hours))
+
+    restored = CadenceLearner(learner.to_store())
+
+    assert restored.cadences == learner.cadences
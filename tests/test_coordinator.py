@@ -0,0 +1,407 @@
+"""Test Volvo Cars coordinator."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from custom_components.volvo_cars.const import DATA_POLLING_MODE
+from custom_components.volvo_cars.coordinator import VolvoCarsDataCoordinator
+from custom_components.volvo_cars.modes import PollingMode
+from custom_components.volvo_cars.store import StoreCapabilities
+from custom_components.volvo_cars.volvo.api import VolvoCarsApi
+from custom_components.volvo_cars.volvo.models import (
+    TokenResponse,
+    VolvoApiException,
+    VolvoCarsValue,
+    VolvoCarsValueField,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .common import load_json_object_fixture
+
+_VIN = "YV1ABCDEFG1234567"
+_RECENT_REPORT_TIME = datetime(2024, 12, 30, 15, 5, tzinfo=UTC)
+
+
+async def _async_setup_coordinator(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> VolvoCarsDataCoordinator:
+    with patch("custom_components.volvo_cars.PLATFORMS", []):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    return mock_config_entry.runtime_data.coordinator
+
+
+async def test_scheduled_refresh_only_due_parts(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test if a scheduled refresh only fetches the parts that are due."""
+
+    # Shortly after the reports of the fixtures, so the car isn't dormant
+    freezer.move_to(_RECENT_REPORT_TIME)
+    coordinator = await _async_setup_coordinator(hass, mock_config_entry)
+    api = coordinator.api
+    api.async_get_availability_status.reset_mock()
+    api.async_get_brakes_status.reset_mock()
+
+    assert coordinator.data[DATA_POLLING_MODE].value != PollingMode.DORMANT
+
+    freezer.tick(timedelta(seconds=135))
+    await coordinator.async_refresh()
+
+    api.async_get_availability_status.assert_awaited_once()
+    api.async_get_brakes_status.assert_not_awaited()
+
+
+async def test_manual_refresh_keeps_dormant(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test if a manual refresh of a dormant car fetches all data only once."""
+
+    # Long after the reports of the fixtures, so the car is dormant
+    freezer.move_to(_RECENT_REPORT_TIME + timedelta(days=1))
+    coordinator = await _async_setup_coordinator(hass, mock_config_entry)
+    api = coordinator.api
+    assert coordinator.data[DATA_POLLING_MODE].value == PollingMode.DORMANT
+
+    api.async_get_brakes_status.reset_mock()
+    await coordinator.async_full_refresh()
+
+    api.async_get_brakes_status.assert_awaited_once()
+    assert coordinator.data[DATA_POLLING_MODE].value == PollingMode.DORMANT
+
+    api.async_get_brakes_status.reset_mock()
+    freezer.tick(timedelta(hours=7))
+    await coordinator.async_refresh()
+
+    api.async_get_brakes_status.assert_not_awaited()
+
+
+async def test_full_refresh(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test if a full refresh fetches all parts."""
+
+    coordinator = await _async_setup_coordinator(hass, mock_config_entry)
+    api = coordinator.api
+    api.async_get_availability_status.reset_mock()
+    api.async_get_brakes_status.reset_mock()
+
+    await coordinator.async_full_refresh()
+
+    api.async_get_availability_status.assert_awaited_once()
+    api.async_get_brakes_status.assert_awaited_once()
+
+
+async def test_capabilities_stored(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test if the detected capabilities are stored."""
+
+    coordinator = await _async_setup_coordinator(hass, mock_config_entry)
+    capabilities = coordinator.store.data.get("capabilities")
+
+    assert capabilities
+    assert capabilities["commands"] == coordinator.commands
+    assert capabilities["supports_doors"] == coordinator.supports_doors
+
+
+async def test_capabilities_from_store(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test if a fresh capability profile skips probing the API."""
+
+    await mock_config_entry.runtime_data.store.async_update(
+        capabilities=StoreCapabilities(
+            commands=["LOCK"],
+            supports_location=True,
+            supports_doors=True,
+            supports_tyres=False,
+            supports_warnings=True,
+            supports_windows=True,
+            unsupported_keys=["frontLeft"],
+            updated_at=datetime.now(UTC).isoformat(),
+        )
+    )
+
+    coordinator = await _async_setup_coordinator(hass, mock_config_entry)
+
+    coordinator.api.async_get_commands.assert_not_awaited()
+    coordinator.api.async_get_tyre_states.assert_not_awaited()
+    assert coordinator.commands == ["LOCK"]
+    assert not coordinator.supports_tyres
+    assert coordinator.unsupported_keys == ["frontLeft"]
+
+
+async def test_failed_probe(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test if a failed probe keeps the results of the other probes."""
+
+    with patch(
+        "custom_components.volvo_cars.VolvoCarsApi.return_value.async_get_tyre_states",
+        side_effect=VolvoApiException("error"),
+    ):
+        coordinator = await _async_setup_coordinator(hass, mock_config_entry)
+
+    assert coordinator.commands
+    assert coordinator.supports_doors
+    assert coordinator.data.get("centralLock")
+
+    # An incomplete profile is not stored
+    assert coordinator.store.data.get("capabilities") is None
+
+
+async def test_failed_setup_cancels_probes(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test if the probes are cancelled when the vehicle details fail."""
+
+    probe_cancelled = asyncio.Event()
+
+    async def _slow_probe() -> dict:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            probe_cancelled.set()
+            raise
+
+        return {}
+
+    with (
+        patch(
+            "custom_components.volvo_cars.VolvoCarsApi.return_value.async_get_tyre_states",
+            new=AsyncMock(side_effect=_slow_probe),
+        ),
+        patch(
+            "custom_components.volvo_cars.VolvoCarsApi.return_value.async_get_vehicle_details",
+            new=AsyncMock(side_effect=VolvoApiException("error")),
+        ),
+        patch("custom_components.volvo_cars.PLATFORMS", []),
+    ):
+        assert not await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert probe_cancelled.is_set()
+
+
+async def test_setup_reuses_probe_data(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test if the probe responses are used as data for the first refresh."""
+
+    coordinator = await _async_setup_coordinator(hass, mock_config_entry)
+    api = coordinator.api
+
+    api.async_get_doors_status.assert_awaited_once()
+    api.async_get_location.assert_awaited_once()
+    api.async_get_availability_status.assert_awaited_once()
+    assert coordinator.data.get("centralLock")
+    assert coordinator.data.get("location")
+
+
+async def test_request_count_excludes_concurrent_command(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Test if a command during a refresh isn't counted by the refresh."""
+
+    coordinator = await _async_setup_coordinator(hass, mock_config_entry)
+    count = coordinator.store.data["api_request_count"]
+
+    # The doors are requested with a real API, so the request is counted
+    vehicle_url = f"https://api.volvocars.com/connected-vehicle/v2/vehicles/{_VIN}"
+    aioclient_mock.get(
+        f"{vehicle_url}/doors", json={"data": load_json_object_fixture("doors")}
+    )
+    aioclient_mock.post(
+        f"{vehicle_url}/commands/lock",
+        json={"data": {"vin": _VIN, "invokeStatus": "COMPLETED", "message": ""}},
+    )
+    api = VolvoCarsApi(async_get_clientsession(hass), _VIN, "key")
+    api.update_access_token(
+        TokenResponse(access_token="", token_type="Bearer", expires_in=1799)
+    )
+
+    refresh_started = asyncio.Event()
+    command_sent = asyncio.Event()
+
+    async def _get_doors() -> dict:
+        refresh_started.set()
+        await command_sent.wait()
+        return await api.async_get_doors_status()
+
+    coordinator.api.async_get_doors_status.side_effect = _get_doors
+    refresh = hass.async_create_task(coordinator.async_full_refresh())
+    await refresh_started.wait()
+
+    # A command counts its own request, like the lock does
+    await api.async_execute_command("lock")
+    coordinator.async_update_request_count(1)
+    command_sent.set()
+    await refresh
+
+    assert aioclient_mock.call_count == 2
+    assert coordinator.store.data["api_request_count"] == count + 2
+
+
+async def test_partial_results_published(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test if results are published before the slower calls finish."""
+
+    coordinator = await _async_setup_coordinator(hass, mock_config_entry)
+    api = coordinator.api
+
+    api.async_get_availability_status.return_value = {
+        "availabilityStatus": VolvoCarsValueField(value="UNAVAILABLE")
+    }
+    release = asyncio.Event()
+
+    async def _async_get_brakes_status() -> dict:
+        await release.wait()
+        return {"brakeFluidLevelWarning": VolvoCarsValueField(value="TOO_LOW")}
+
+    api.async_get_brakes_status.side_effect = _async_get_brakes_status
+
+    availability_listener = MagicMock()
+    brakes_listener = MagicMock()
+    coordinator.async_add_listener(availability_listener, "availabilityStatus")
+    coordinator.async_add_listener(brakes_listener, "brakeFluidLevelWarning")
+
+    task = hass.async_create_task(coordinator.async_full_refresh())
+    await asyncio.sleep(0.1)
+
+    availability_listener.assert_called_once()
+    brakes_listener.assert_not_called()
+
+    release.set()
+    await task
+
+    brakes_listener.assert_called_once()
+
+
+async def test_only_changed_fields_notified(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test if only the listeners of changed fields are notified."""
+
+    coordinator = await _async_setup_coordinator(hass, mock_config_entry)
+    api = coordinator.api
+
+    api.async_get_availability_status.return_value = {
+        "availabilityStatus": VolvoCarsValueField(value="UNAVAILABLE")
+    }
+
+    availability_listener = MagicMock()
+    brakes_listener = MagicMock()
+    unbound_listener = MagicMock()
+    coordinator.async_add_listener(availability_listener, "availabilityStatus")
+    coordinator.async_add_listener(brakes_listener, "brakeFluidLevelWarning")
+    coordinator.async_add_listener(unbound_listener)
+
+    await coordinator.async_full_refresh()
+
+    availability_listener.assert_called_once()
+    brakes_listener.assert_not_called()
+    unbound_listener.assert_called_once()
+
+
+async def test_staleness(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test the staleness per field."""
+
+    coordinator = await _async_setup_coordinator(hass, mock_config_entry)
+    staleness = coordinator.get_staleness()
+
+    assert staleness["odometer"] > 0
+    assert "apiStatus" not in staleness
+
+
+async def test_api_status_cached(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test if the API status is not checked on every refresh."""
+
+    coordinator = await _async_setup_coordinator(hass, mock_config_entry)
+    api = coordinator.api
+    api.async_get_api_status.reset_mock()
+
+    await coordinator.async_full_refresh()
+
+    api.async_get_api_status.assert_not_awaited()
+
+
+async def test_api_outage(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test if no data is requested during an API outage."""
+
+    coordinator = await _async_setup_coordinator(hass, mock_config_entry)
+    api = coordinator.api
+    api.async_get_api_status.return_value = {
+        "apiStatus": VolvoCarsValue("Planned maintenance")
+    }
+    api.async_get_availability_status.reset_mock()
+
+    freezer.tick(timedelta(minutes=10))
+    await coordinator.async_full_refresh()
+
+    api.async_get_availability_status.assert_not_awaited()
+    assert coordinator.api_outage
+    assert coordinator.last_update_success
+    assert coordinator.data.get("availabilityStatus")
+
+    # The outage is only logged once
+    freezer.tick(timedelta(minutes=10))
+    await coordinator.async_full_refresh()
+
+    assert caplog.text.count("Volvo API reports: Planned maintenance") == 1
+
+    # The outage isn't cached, so the recovery is picked up on the next update
+    api.async_get_api_status.return_value = {"apiStatus": VolvoCarsValue("OK")}
+    freezer.tick(timedelta(seconds=135))
+    await coordinator.async_refresh()
+
+    api.async_get_availability_status.assert_awaited_once()
+    assert not coordinator.api_outage
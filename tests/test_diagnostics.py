@@ -0,0 +1,33 @@
+"""Test Volvo Cars diagnostics."""
+
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.components.diagnostics import (
+    get_diagnostics_for_config_entry,
+)
+from pytest_homeassistant_custom_component.typing import ClientSessionGenerator
+
+from homeassistant.core import HomeAssistant
+
+
+async def test_model_extra_data(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test if the diagnostics contain the extra data of the models."""
+
+    with patch("custom_components.volvo_cars.PLATFORMS", []):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    diagnostics = await get_diagnostics_for_config_entry(
+        hass, hass_client, mock_config_entry
+    )
+
+    assert diagnostics["vehicle"]["extra_data"] == {}
+    assert diagnostics["vehicle"]["images"]["extra_data"] == {}
+    assert diagnostics["coordinator"]["odometer"]["extra_data"] == {}
+    assert diagnostics["coordinator"]["odometer"]["value"]
@@ -0,0 +1,36 @@
+"""Test Volvo Cars API request metrics."""
+
+from custom_components.volvo_cars.volvo.metrics import (
+    VolvoCarsRequestMetrics,
+    get_percentiles,
+)
+
+
+def test_percentiles() -> None:
+    """Test if the percentiles use the nearest rank."""
+
+    latencies = [n / 1000 for n in range(1, 101)]
+
+    assert get_percentiles(latencies) == {"p50": 50.0, "p95": 95.0, "p99": 99.0}
+    assert get_percentiles([]) == {"p50": None, "p95": None, "p99": None}
+
+
+def test_metrics_per_operation() -> None:
+    """Test if requests are recorded per operation."""
+
+    metrics = VolvoCarsRequestMetrics()
+    metrics.record("doors", 0.2, 100, None)
+    metrics.record("doors", 0.4, 0, "500")
+    metrics.record("tyres", 0.1, 50, "TimeoutError")
+    metrics.record("tyres", 0.1, 50, None)
+
+    assert metrics.errors == 2
+    assert metrics.operations["tyres"].retries == 1
+    assert metrics.get_latency(50) == 100.0
+    assert metrics.as_dict()["doors"] == {
+        "requests": 2,
+        "retries": 0,
+        "errors": {"500": 1},
+        "bytes_received": 100,
+        "latency_ms": {"p50": 200.0, "p95": 400.0, "p99": 400.0},
+    }
@@ -0,0 +1,148 @@
+"""Test Volvo Cars polling modes."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from custom_components.volvo_cars.modes import (
+    DormancyDetector,
+    MotionDetector,
+    PollingMode,
+    get_polling_mode,
+)
+from custom_components.volvo_cars.volvo.models import (
+    VolvoCarsApiBaseModel,
+    VolvoCarsLocation,
+    VolvoCarsValueField,
+)
+
+from .common import load_json_object_fixture
+
+
+def _location(longitude: float, latitude: float) -> VolvoCarsLocation | None:
+    data = dict(load_json_object_fixture("location"))
+    data["geometry"] = {"type": "Point", "coordinates": [longitude, latitude, 0.0]}
+    return VolvoCarsLocation.from_dict(data)
+
+
+def test_motion_engine_running() -> None:
+    """Test if a running engine is detected as motion."""
+
+    detector = MotionDetector()
+    data = {"engineStatus": VolvoCarsValueField(value="RUNNING")}
+
+    assert detector.update(data, 600)
+    assert not detector.in_motion(0)
+
+
+def test_motion_location() -> None:
+    """Test if a change in location is detected as motion."""
+
+    detector = MotionDetector()
+
+    assert not detector.update({"location": _location(11.85, 57.72)}, 600)
+    assert not detector.update({"location": _location(11.85001, 57.72)}, 600)
+    assert detector.update({"location": _location(11.86, 57.72)}, 600)
+
+
+@pytest.mark.parametrize(
+    ("in_motion", "system_status", "connection_status", "mode"),
+    [
+        (True, None, None, PollingMode.DRIVING),
+        (False, None, None, PollingMode.IDLE),
+        (
+            False,
+            "CHARGING_SYSTEM_IDLE",
+            "CONNECTION_STATUS_DISCONNECTED",
+            PollingMode.IDLE,
+        ),
+        (
+            False,
+            "CHARGING_SYSTEM_IDLE",
+            "CONNECTION_STATUS_CONNECTED_AC",
+            PollingMode.PLUGGED_IN,
+        ),
+        (
+            False,
+            "CHARGING_SYSTEM_CHARGING",
+            "CONNECTION_STATUS_CONNECTED_DC",
+            PollingMode.CHARGING,
+        ),
+        (
+            False,
+            "CHARGING_SYSTEM_FAULT",
+            "CONNECTION_STATUS_FAULT",
+            PollingMode.IDLE,
+        ),
+        (
+            False,
+            "CHARGING_SYSTEM_UNSPECIFIED",
+            "CONNECTION_STATUS_UNSPECIFIED",
+            PollingMode.IDLE,
+        ),
+    ],
+)
+def test_polling_mode(
+    in_motion: bool,
+    system_status: str | None,
+    connection_status: str | None,
+    mode: PollingMode,
+) -> None:
+    """Test determining the polling mode."""
+
+    data: dict[str, VolvoCarsApiBaseModel | None] = {}
+
+    if system_status:
+        data["chargingSystemStatus"] = VolvoCarsValueField(value=system_status)
+
+    if connection_status:
+        data["chargingConnectionStatus"] = VolvoCarsValueField(value=connection_status)
+
+    assert get_polling_mode(data, in_motion) == mode
+
+
+def test_dormancy() -> None:
+    """Test if a car that didn't report for hours is dormant."""
+
+    detector = DormancyDetector()
+    now = datetime.now(UTC)
+
+    assert not detector.update("AVAILABLE", now - timedelta(hours=1))
+    assert detector.update("AVAILABLE", now - timedelta(hours=7))
+
+    # A change of the heartbeat wakes the car up
+    assert not detector.update("UNAVAILABLE", now - timedelta(hours=7))
+
+
+def test_dormancy_wake() -> None:
+    """Test if waking up prevents the dormant mode."""
+
+    detector = DormancyDetector()
+    detector.wake()
+
+    assert not detector.update(None, datetime.now(UTC) - timedelta(hours=7))
+
+
+def test_dormant_polling_mode() -> None:
+    """Test if charging takes precedence over the dormant mode."""
+
+    data: dict[str, VolvoCarsApiBaseModel | None] = {
+        "chargingSystemStatus": VolvoCarsValueField(value="CHARGING_SYSTEM_CHARGING")
+    }
+
+    assert get_polling_mode({}, False, True) == PollingMode.DORMANT
+    assert get_polling_mode(data, False, True) == PollingMode.CHARGING
+
+
+def test_plugged_in_dormant_polling_mode() -> None:
+    """Test if a car that is plugged in without charging can become dormant."""
+
+    data: dict[str, VolvoCarsApiBaseModel | None] = {
+        "chargingSystemStatus": VolvoCarsValueField(value="CHARGING_SYSTEM_IDLE"),
+        "chargingConnectionStatus": VolvoCarsValueField(
+            value="CONNECTION_STATUS_CONNECTED_AC"
+        ),
+    }
+
+    assert get_polling_mode(data, False) == PollingMode.PLUGGED_IN
+    assert get_polling_mode(data, False, True) == PollingMode.DORMANT
@@ -0,0 +1,49 @@
+"""Test Volvo Cars API quota governor."""
+
+import pytest
+
+from custom_components.volvo_cars.quota import QuotaGovernor
+from custom_components.volvo_cars.scheduler import RefreshThrottle
+
+
+def test_within_budget() -> None:
+    """Test if the schedule is not throttled when the budget suffices."""
+
+    governor = QuotaGovernor(10000)
+    projection = governor.evaluate(1000, 5000, 100)
+
+    assert projection.throttle == RefreshThrottle()
+    assert projection.projected == 6000
+    assert projection.headroom == 4000
+
+
+def test_pause_low_priority() -> None:
+    """Test if low priority parts are paused before stretching."""
+
+    governor = QuotaGovernor(10000)
+    projection = governor.evaluate(1000, 8600, 200)
+
+    assert projection.throttle.pause_low_priority
+    assert projection.throttle.stretch == 1.0
+    assert projection.projected == 9400
+
+
+@pytest.mark.parametrize(("used"), [(1000), (5000)])
+def test_stretch(used: int) -> None:
+    """Test if intervals are stretched to stay within budget."""
+
+    governor = QuotaGovernor(10000)
+    projection = governor.evaluate(used, 20000, 500)
+
+    assert projection.throttle.stretch > 1
+    assert projection.projected <= 9500
+
+
+def test_budget_used() -> None:
+    """Test if all parts are paused when the budget is used."""
+
+    governor = QuotaGovernor(10000)
+    projection = governor.evaluate(9600, 1000, 100)
+
+    assert projection.throttle.pause_all
+    assert projection.projected == 9600
@@ -0,0 +1,33 @@
+"""Test Volvo Cars refresh scheduler."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+from freezegun.api import FrozenDateTimeFactory
+
+from custom_components.volvo_cars.scheduler import (
+    RefreshCadence,
+    RefreshPart,
+    RefreshScheduler,
+)
+
+
+def test_failed_part_waits_for_interval(freezer: FrozenDateTimeFactory) -> None:
+    """Test if a failed part is retried after its normal interval."""
+
+    scheduler = RefreshScheduler()
+    scheduler.set_parts(
+        {
+            "doors": RefreshPart(AsyncMock(), True, RefreshCadence.FAST),
+            "tyres": RefreshPart(AsyncMock(), True, RefreshCadence.FAST),
+        }
+    )
+    scheduler.mark_refreshed("doors")
+    scheduler.mark_failed("tyres")
+
+    assert scheduler.get_due_parts(120) == []
+    assert scheduler.get_next_delay(120) == 120
+
+    freezer.tick(timedelta(seconds=120))
+
+    assert scheduler.get_due_parts(120) == ["doors", "tyres"]
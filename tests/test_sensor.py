@@ -1,5 +1,6 @@
 """Test Volvo Cars sensors."""
 
+from dataclasses import replace
 from unittest.mock import patch
 
 import pytest
@@ -147,3 +148,44 @@ async def test_energy_unit_conversion(
         assert entity
         assert entity.state == value
         assert entity.attributes.get("unit_of_measurement") == unit_of_measurement
+
+
+async def test_same_report_not_written(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test if the state is not written when the car reported nothing new."""
+
+    entity_id = "sensor.volvo_myvolvo_odometer"
+
+    with patch("custom_components.volvo_cars.PLATFORMS", [Platform.SENSOR]):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = mock_config_entry.runtime_data.coordinator
+    state = hass.states.get(entity_id)
+    assert state
+
+    # Same report, but a different object
+    odometer = coordinator.data["odometer"]
+    assert odometer
+    coordinator.async_set_updated_data(
+        coordinator.data | {"odometer": replace(odometer)}
+    )
+    await hass.async_block_till_done()
+
+    new_state = hass.states.get(entity_id)
+    assert new_state
+    assert new_state.last_reported == state.last_reported
+
+    # A change of the extra data at the same timestamp is written
+    coordinator.async_set_updated_data(
+        coordinator.data
+        | {"odometer": replace(odometer, extra_data={"unavailable_reason": "x"})}
+    )
+    await hass.async_block_till_done()
+
+    new_state = hass.states.get(entity_id)
+    assert new_state
+    assert new_state.last_reported != state.last_reported
@@ -0,0 +1,51 @@
+"""Test Volvo Cars store."""
+
+from typing import Any
+
+from custom_components.volvo_cars.const import DOMAIN
+from custom_components.volvo_cars.store import VolvoCarsStoreManager
+from homeassistant.core import HomeAssistant
+
+
+async def test_delayed_updates_coalesced(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test if delayed updates are written together."""
+
+    store = VolvoCarsStoreManager(hass, "YV1ABCDEFG1234567")
+    await store.async_load()
+
+    store.async_delay_update(api_request_count=1)
+    store.async_delay_update(api_request_count=2)
+
+    assert f"{DOMAIN}.YV1ABCDEFG1234567" not in hass_storage
+    assert store.write_counters.coalesced == 1
+
+    # Pending updates are not lost when loading
+    assert (await store.async_load())["api_request_count"] == 2
+
+    await store.async_flush()
+
+    stored = hass_storage[f"{DOMAIN}.YV1ABCDEFG1234567"]["data"]
+    assert stored["api_request_count"] == 2
+    assert store.write_counters.written == 1
+
+
+async def test_immediate_update_writes_pending(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test if an immediate update also writes the pending updates."""
+
+    store = VolvoCarsStoreManager(hass, "YV1ABCDEFG1234567")
+    await store.async_load()
+
+    store.async_delay_update(api_request_count=5)
+    await store.async_update(access_token="token")
+
+    stored = hass_storage[f"{DOMAIN}.YV1ABCDEFG1234567"]["data"]
+    assert stored["api_request_count"] == 5
+    assert stored["access_token"] == "token"
+
+    # Nothing left to flush
+    await store.async_flush()
+    assert store.write_counters.written == 1
@@ -0,0 +1,67 @@
+"""Test Volvo Cars tracing."""
+
+import asyncio
+
+from custom_components.volvo_cars.volvo.tracing import VolvoCarsTracer, span
+
+
+def test_tracing_disabled() -> None:
+    """Test if nothing is recorded when tracing is disabled."""
+
+    tracer = VolvoCarsTracer(5)
+
+    with tracer.trace("refresh"), span("request"):
+        pass
+
+    assert tracer.as_list() == []
+
+
+def test_span_outside_trace() -> None:
+    """Test if spans outside a trace share a no-op context manager."""
+
+    assert span("request") is span("notify", key="value")
+
+
+async def test_span_tree() -> None:
+    """Test if spans of tasks are added to the trace."""
+
+    async def _request(operation: str) -> None:
+        with span("request", operation=operation), span("http"):
+            await asyncio.sleep(0)
+
+    tracer = VolvoCarsTracer(5, enabled=True)
+
+    with tracer.trace("refresh"):
+        await asyncio.gather(_request("doors"), _request("tyres"))
+
+        with span("notify"):
+            pass
+
+    # Spans outside a trace are ignored
+    with span("request"):
+        pass
+
+    (trace,) = tracer.as_list()
+    assert trace["name"] == "refresh"
+    assert [child["name"] for child in trace["children"]] == [
+        "request",
+        "request",
+        "notify",
+    ]
+
+    request = trace["children"][0]
+    assert request["operation"] == "doors"
+    assert request["children"][0]["name"] == "http"
+    assert request["duration_ms"] >= request["children"][0]["duration_ms"]
+
+
+def test_ring_buffer() -> None:
+    """Test if only the most recent traces are kept."""
+
+    tracer = VolvoCarsTracer(2, enabled=True)
+
+    for index in range(3):
+        with tracer.trace("refresh", index=index):
+            pass
+
+    assert [trace["index"] for trace in tracer.as_list()] == [1, 2]
@@ -0,0 +1,37 @@
+"""Test Volvo API utils."""
+
+from datetime import UTC, datetime
+
+from custom_components.volvo_cars.volvo.util import (
+    parse_timestamp,
+    seed_json_keys,
+    translate_json_key,
+)
+
+
+def test_translate_json_key() -> None:
+    """Test if JSON keys are translated to model field names."""
+
+    assert translate_json_key("frontLeftDoor") == "front_left_door"
+    assert translate_json_key("descriptions") == "description"
+    assert translate_json_key("vin") == "vin"
+
+
+def test_seeded_keys_cached() -> None:
+    """Test if seeded keys are translated without a cache miss."""
+
+    seed_json_keys(["exterior_image_url"])
+    misses = translate_json_key.cache_info().misses
+
+    assert translate_json_key("exteriorImageUrl") == "exterior_image_url"
+    assert translate_json_key.cache_info().misses == misses
+
+
+def test_parse_timestamp() -> None:
+    """Test if identical timestamps share the parsed datetime."""
+
+    timestamp = parse_timestamp("2024-12-30T14:18:56.849Z")
+
+    assert timestamp == datetime(2024, 12, 30, 14, 18, 56, 849000, tzinfo=UTC)
+    assert parse_timestamp("2024-12-30T14:18:56.849Z") is timestamp
+    assert parse_timestamp("2024-12-30T14:19:56.849Z") is not timestamp